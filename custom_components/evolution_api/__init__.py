@@ -1,23 +1,39 @@
 """The Evolution API integration."""
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import os
-import base64
 import mimetypes
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Iterable
+from datetime import timedelta
 from typing import Any
 
+import aiohttp
 import voluptuous as vol
 
+try:
+    # SIMD-accelerated encoder, used when it happens to be installed
+    from pybase64 import b64encode
+except ImportError:
+    from base64 import b64encode
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import raise_if_invalid_path
 
 PLATFORMS = [Platform.SENSOR, Platform.BUTTON, Platform.MEDIA_PLAYER]
 
 from .api import EvolutionApiClient, EvolutionApiError
+from .coordinator import EvolutionApiCoordinator
 from .storage import EvolutionApiStorage
 from .const import (
     ATTR_AUDIO_URL,
@@ -47,10 +63,12 @@ from .const import (
     ATTR_POLL_OPTIONS,
     ATTR_REACTION,
     ATTR_STICKER_URL,
+    ATTR_USE_URL,
     CONF_API_KEY,
     CONF_INSTANCE_ID,
     CONF_SERVER_URL,
     CONF_VERIFY_SSL,
+    DATA_CLIENTS,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
     SERVICE_CHECK_NUMBER,
@@ -58,36 +76,169 @@ from .const import (
     SERVICE_SEND_CONTACT,
     SERVICE_SEND_LOCATION,
     SERVICE_SEND_MEDIA,
+    SERVICE_REFRESH_GROUPS,
     SERVICE_SEND_POLL,
     SERVICE_SEND_REACTION,
     SERVICE_SEND_STICKER,
     SERVICE_SEND_TEXT,
+    SIGNAL_GROUPS_UPDATED,
 )
 
-SERVICE_REFRESH_GROUPS = "refresh_groups"
-
 _LOGGER = logging.getLogger(__name__)
 
+_ServiceHandler = Callable[[HomeAssistant, ServiceCall], Awaitable[Any]]
+
+# Read size for streamed media downloads
+_MEDIA_CHUNK_SIZE = 64 * 1024
+# Amount of downloaded media collected before encoding it in the executor
+_MEDIA_ENCODE_BATCH = 1024 * 1024
+# Attempts and initial backoff in seconds for loopback media-source fetches
+_MEDIA_FETCH_ATTEMPTS = 3
+_MEDIA_FETCH_BACKOFF = 0.1
+# Lifetime of signed media-source URLs handed to the Evolution API server
+_MEDIA_URL_TTL = timedelta(minutes=5)
+# media-source URIs served by the local media directories
+_LOCAL_MEDIA_SOURCE_PREFIX = "media-source://media_source/"
+# Read size for local media files, a multiple of 3 for padding-free pieces
+_FILE_READ_SIZE = 3 * 21844
+
+# Bounds for the cache of encoded local files
+_MEDIA_CACHE_MAX_ENTRIES = 32
+_MEDIA_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+
+class _MediaCache:
+    """LRU cache of base64 payloads, bounded by entry count and total size."""
+
+    def __init__(self, max_entries: int, max_bytes: int) -> None:
+        """Initialize the cache."""
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Any, ...], str] = OrderedDict()
+        self._size = 0
+        # Files are encoded in executor threads, so guard concurrent access
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple[Any, ...]) -> str | None:
+        """Return a cached payload and mark it as recently used."""
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is not None:
+                self._entries.move_to_end(key)
+            return payload
+
+    def put(self, key: tuple[Any, ...], payload: str) -> None:
+        """Store a payload, evicting the least recently used ones as needed."""
+        if len(payload) > self._max_bytes:
+            return
+        with self._lock:
+            if (old := self._entries.pop(key, None)) is not None:
+                self._size -= len(old)
+            self._entries[key] = payload
+            self._size += len(payload)
+            while (
+                len(self._entries) > self._max_entries
+                or self._size > self._max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+
+    def clear(self) -> None:
+        """Drop every cached payload."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+
+_MEDIA_CACHE = _MediaCache(_MEDIA_CACHE_MAX_ENTRIES, _MEDIA_CACHE_MAX_BYTES)
+
+
 # --- ADDED: Helper to read local files as Base64 ---
 def encode_file(file_path):
     """Reads a local file and converts it to a Raw Base64 string."""
     try:
-        if not os.path.exists(file_path):
+        try:
+            stat = os.stat(file_path)
+        except FileNotFoundError:
             _LOGGER.error(f"File not found: {file_path}")
             return None
+        # Re-sending the same sticker or image is common, and the mtime and
+        # size in the key make an edited file miss the cache
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        if (cached := _MEDIA_CACHE.get(key)) is not None:
+            return cached
+        buffer = bytearray()
         with open(file_path, "rb") as image_file:
-            return base64.b64encode(image_file.read()).decode('utf-8')
+            # Full reads are a multiple of 3 bytes and encode without padding,
+            # so only one read's worth of raw data is held at a time
+            while chunk := image_file.read(_FILE_READ_SIZE):
+                buffer += b64encode(chunk)
+        encoded = buffer.decode("ascii")
+        _MEDIA_CACHE.put(key, encoded)
+        return encoded
     except Exception as e:
         _LOGGER.error(f"Error reading file {file_path}: {e}")
         return None
 
+
+async def _async_encode_stream(
+    hass: HomeAssistant, content: aiohttp.StreamReader, size_hint: int | None
+) -> str:
+    """Base64-encode a response body chunk by chunk as it arrives."""
+    # Encoding 3-byte aligned batches lets the outputs be joined without
+    # padding, so the raw body never has to be held in memory at once.
+    # The output is sized up front from Content-Length when there is one;
+    # writes past the end still extend it and unused space is trimmed.
+    encoded = bytearray(4 * ((size_hint + 2) // 3) if size_hint else 0)
+    written = 0
+    pending = bytearray()
+    async for chunk in content.iter_chunked(_MEDIA_CHUNK_SIZE):
+        pending += chunk
+        if len(pending) >= _MEDIA_ENCODE_BATCH:
+            aligned = len(pending) - len(pending) % 3
+            batch = bytes(pending[:aligned])
+            del pending[:aligned]
+            # Large batches are encoded off the event loop
+            piece = await hass.async_add_executor_job(b64encode, batch)
+            encoded[written : written + len(piece)] = piece
+            written += len(piece)
+    piece = b64encode(pending)
+    encoded[written : written + len(piece)] = piece
+    written += len(piece)
+    del encoded[written:]
+    return encoded.decode("ascii")
+
+
+def _local_media_path(hass: HomeAssistant, path_or_url: str) -> str | None:
+    """Map a local media-source URI to a file under the media directories."""
+    if not path_or_url.startswith(_LOCAL_MEDIA_SOURCE_PREFIX):
+        return None
+    # Same identifier layout the media_source local source resolves
+    source_dir_id, _, location = path_or_url[
+        len(_LOCAL_MEDIA_SOURCE_PREFIX) :
+    ].partition("/")
+    media_dir = hass.config.media_dirs.get(source_dir_id)
+    if media_dir is None or not location:
+        return None
+    try:
+        raise_if_invalid_path(location)
+    except ValueError:
+        return None
+    return os.path.join(media_dir, location)
+
+
 # --- ADDED: Smart Media Resolver ---
-async def get_media_content(hass: HomeAssistant, path_or_url: str):
+async def get_media_content(
+    hass: HomeAssistant, path_or_url: str, use_url: bool = False
+):
     """
     Handles:
     1. http://... (Returns URL as-is)
-    2. media-source://... (Resolves to internal URL -> Downloads -> Returns Base64)
+    2. media-source://... (Resolves to internal URL -> Downloads -> Returns Base64,
+       or returns a signed Home Assistant URL when use_url is set)
     3. /config/..., /media/... (Reads local file -> Returns Base64)
+
+    Raises EvolutionApiError if a media-source download keeps failing.
     """
     if not path_or_url:
         return None
@@ -96,6 +247,11 @@ async def get_media_content(hass: HomeAssistant, path_or_url: str):
     if path_or_url.startswith("http"):
         return path_or_url
 
+    # Media from a local media directory is read straight from disk,
+    # skipping the HTTP round-trip through Home Assistant
+    if not use_url and (local_path := _local_media_path(hass, path_or_url)):
+        return await hass.async_add_executor_job(encode_file, local_path)
+
     # 2. Home Assistant Media Source (media-source://)
     if path_or_url.startswith("media-source://"):
         try:
@@ -105,20 +261,53 @@ async def get_media_content(hass: HomeAssistant, path_or_url: str):
             # Resolve the virtual path to a play URL
             play_media = await media_source.async_resolve_media(hass, path_or_url, None)
             url = play_media.url
-            
+
+            # Let the Evolution server download the media itself instead of
+            # inlining it as base64, if Home Assistant has a URL to give out
+            if use_url:
+                if not url.startswith("/"):
+                    return url
+                from homeassistant.components.http.auth import async_sign_path
+                from homeassistant.helpers.network import NoURLAvailableError, get_url
+
+                try:
+                    base_url = get_url(hass)
+                except NoURLAvailableError as err:
+                    _LOGGER.warning(
+                        "No Home Assistant URL for media-source, sending inline: %s",
+                        err,
+                    )
+                else:
+                    # The link goes to a third-party server, so it is signed
+                    # for the content user and only long enough to download
+                    return base_url + async_sign_path(
+                        hass, url, _MEDIA_URL_TTL, use_content_user=True
+                    )
+
             # If it's a relative URL (e.g. /media/local/...), prepend HA's internal address
             if url.startswith("/"):
                 url = f"http://127.0.0.1:{hass.http.server_port}{url}"
 
-            # Download the data internally
+            # Download the data internally, retrying briefly on server errors
+            # and dropped connections while Home Assistant is busy
             session = async_get_clientsession(hass)
-            async with session.get(url) as response:
-                if response.status == 200:
-                    data = await response.read()
-                    return base64.b64encode(data).decode('utf-8')
-                else:
-                    _LOGGER.error(f"Failed to fetch media-source: {response.status}")
-                    return None
+            for attempt in range(_MEDIA_FETCH_ATTEMPTS):
+                if attempt:
+                    await asyncio.sleep(_MEDIA_FETCH_BACKOFF * (1 << (attempt - 1)))
+                try:
+                    async with session.get(url) as response:
+                        if response.status == 200:
+                            return await _async_encode_stream(
+                                hass, response.content, response.content_length
+                            )
+                        error = f"HTTP {response.status}"
+                        if response.status < 500:
+                            break
+                except aiohttp.ClientConnectionError as err:
+                    error = str(err)
+            raise EvolutionApiError(f"Failed to fetch media-source: {error}")
+        except EvolutionApiError:
+            raise
         except Exception as e:
             _LOGGER.error(f"Error resolving media-source: {e}")
             return None
@@ -127,89 +316,154 @@ async def get_media_content(hass: HomeAssistant, path_or_url: str):
     return await hass.async_add_executor_job(encode_file, path_or_url)
 
 
+@functools.lru_cache(maxsize=128)
+def _parse_poll_options(options: str) -> tuple[str, ...]:
+    """Parse poll options from a comma-separated string."""
+    # Automations tend to resend the same poll, so repeat strings hit the cache
+    return tuple(opt for opt in (part.strip() for part in options.split(",")) if opt)
+
+
+def _poll_options(value: str | list[str]) -> list[str]:
+    """Validate poll options given as a list or a comma-separated string."""
+    if isinstance(value, str):
+        options = list(_parse_poll_options(value))
+    else:
+        options = [opt for opt in (part.strip() for part in value) if opt]
+    if not options:
+        raise vol.Invalid("At least one poll option is required")
+    return options
+
+
 # Service schemas - Updated to use ATTR_TARGET
-SERVICE_SEND_TEXT_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_MESSAGE): cv.string,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-        vol.Optional(ATTR_LINK_PREVIEW, default=True): cv.boolean,
-        vol.Optional(ATTR_MENTION_ALL, default=False): cv.boolean,
-    }
+# Voluptuous compiles each schema once when it is constructed, so the shared
+# recipient fields are declared a single time and spread into every schema.
+_TARGET_FIELDS = {
+    vol.Required(ATTR_TARGET): cv.string,
+    vol.Optional(ATTR_INSTANCE_ID): cv.string,
+}
+
+# Optional send delay shared by the services whose endpoint accepts one
+_DELAY_FIELD = {vol.Optional(ATTR_DELAY, default=0): cv.positive_int}
+
+# Opt-in for sending media-source media as a signed URL instead of base64
+_USE_URL_FIELD = {vol.Optional(ATTR_USE_URL, default=False): cv.boolean}
+
+# Service fields whose client keyword argument has a different name
+_CLIENT_KWARG_NAMES = {
+    ATTR_TARGET: "number",
+    ATTR_MESSAGE: "text",
+    ATTR_POLL_OPTIONS: "options",
+}
+
+
+def _to_client_kwargs(data: dict[str, Any]) -> dict[str, Any]:
+    """Rename validated service fields to the client method's keyword arguments."""
+    return {_CLIENT_KWARG_NAMES.get(key, key): value for key, value in data.items()}
+
+
+SERVICE_SEND_TEXT_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_MESSAGE): cv.string,
+            **_DELAY_FIELD,
+            vol.Optional(ATTR_LINK_PREVIEW, default=True): cv.boolean,
+            vol.Optional(ATTR_MENTION_ALL, default=False): cv.boolean,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_MEDIA_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_MEDIA_URL): cv.string,
-        vol.Required(ATTR_MEDIA_TYPE): vol.In(["image", "video", "document"]),
-        vol.Optional(ATTR_MEDIA_CAPTION): cv.string,
-        vol.Optional(ATTR_FILENAME): cv.string,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-    }
+SERVICE_SEND_MEDIA_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_MEDIA_URL): cv.string,
+            **_USE_URL_FIELD,
+            vol.Required(ATTR_MEDIA_TYPE): vol.In(["image", "video", "document"]),
+            vol.Optional(ATTR_MEDIA_CAPTION): cv.string,
+            vol.Optional(ATTR_FILENAME): cv.string,
+            **_DELAY_FIELD,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_AUDIO_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_AUDIO_URL): cv.string,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-    }
+SERVICE_SEND_AUDIO_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_AUDIO_URL): cv.string,
+            **_USE_URL_FIELD,
+            **_DELAY_FIELD,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_STICKER_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_STICKER_URL): cv.string,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-    }
+SERVICE_SEND_STICKER_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_STICKER_URL): cv.string,
+            **_USE_URL_FIELD,
+            **_DELAY_FIELD,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_LOCATION_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_LATITUDE): vol.Coerce(float),
-        vol.Required(ATTR_LONGITUDE): vol.Coerce(float),
-        vol.Optional(ATTR_LOCATION_NAME): cv.string,
-        vol.Optional(ATTR_LOCATION_ADDRESS): cv.string,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-    }
+SERVICE_SEND_LOCATION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_LATITUDE): vol.Coerce(float),
+            vol.Required(ATTR_LONGITUDE): vol.Coerce(float),
+            vol.Optional(ATTR_LOCATION_NAME): cv.string,
+            vol.Optional(ATTR_LOCATION_ADDRESS): cv.string,
+            **_DELAY_FIELD,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_CONTACT_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_CONTACT_NAME): cv.string,
-        vol.Required(ATTR_CONTACT_PHONE): cv.string,
-        vol.Optional(ATTR_CONTACT_EMAIL): cv.string,
-        vol.Optional(ATTR_CONTACT_ORG): cv.string,
-    }
+SERVICE_SEND_CONTACT_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_CONTACT_NAME): cv.string,
+            vol.Required(ATTR_CONTACT_PHONE): cv.string,
+            vol.Optional(ATTR_CONTACT_EMAIL): cv.string,
+            vol.Optional(ATTR_CONTACT_ORG): cv.string,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_REACTION_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_MESSAGE_ID): cv.string,
-        vol.Required(ATTR_REACTION): cv.string,
-    }
+SERVICE_SEND_REACTION_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_MESSAGE_ID): cv.string,
+            vol.Required(ATTR_REACTION): cv.string,
+        }
+    ),
+    _to_client_kwargs,
 )
 
-SERVICE_SEND_POLL_SCHEMA = vol.Schema(
-    {
-        vol.Required(ATTR_TARGET): cv.string,
-        vol.Optional(ATTR_INSTANCE_ID): cv.string,
-        vol.Required(ATTR_POLL_NAME): cv.string,
-        vol.Required(ATTR_POLL_OPTIONS): cv.string,
-        vol.Optional(ATTR_POLL_MAX_SELECTIONS, default=1): cv.positive_int,
-        vol.Optional(ATTR_DELAY, default=0): cv.positive_int,
-    }
+SERVICE_SEND_POLL_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            **_TARGET_FIELDS,
+            vol.Required(ATTR_POLL_NAME): cv.string,
+            vol.Required(ATTR_POLL_OPTIONS): vol.All(
+                vol.Any(cv.string, [cv.string]), _poll_options
+            ),
+            vol.Optional(ATTR_POLL_MAX_SELECTIONS, default=1): cv.positive_int,
+            **_DELAY_FIELD,
+        }
+    ),
+    _to_client_kwargs,
 )
 
 SERVICE_CHECK_NUMBER_SCHEMA = vol.Schema(
@@ -223,29 +477,44 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Evolution API from a config entry."""
     hass.data.setdefault(DOMAIN, {})
 
-    # Create API client
-    session = async_get_clientsession(hass)
+    # Create API client on Home Assistant's shared, keep-alive pooled session
+    verify_ssl = entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+    session = async_get_clientsession(hass, verify_ssl=verify_ssl)
     client = EvolutionApiClient(
         session=session,
         server_url=entry.data[CONF_SERVER_URL],
         instance_id=entry.data[CONF_INSTANCE_ID],
         api_key=entry.data[CONF_API_KEY],
-        verify_ssl=entry.data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+        verify_ssl=verify_ssl,
     )
 
     # Initialize persistent storage
     storage = EvolutionApiStorage(hass, entry.entry_id)
     await storage.async_load()
 
-    # Store the client and storage
+    # One coordinator per entry polls the connection state for every platform
+    coordinator = EvolutionApiCoordinator(hass, client, entry.data[CONF_INSTANCE_ID])
+    await coordinator.async_config_entry_first_refresh()
+
+    # Store the client, coordinator and storage, and the device every
+    # platform's entities are attached to
     hass.data[DOMAIN][entry.entry_id] = {
         "client": client,
         "config": entry.data,
+        "coordinator": coordinator,
+        "device_info": DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            name=f"Evolution API ({entry.data[CONF_INSTANCE_ID]})",
+            manufacturer="Evolution API",
+            model="WhatsApp Instance",
+            configuration_url=entry.data[CONF_SERVER_URL],
+        ),
         "storage": storage,
     }
+    hass.data.setdefault(DATA_CLIENTS, {})[entry.data[CONF_INSTANCE_ID]] = client
 
     # Register services
-    await _async_register_services(hass)
+    _async_register_services(hass)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -262,309 +531,246 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        clients = hass.data[DATA_CLIENTS]
+        # Another entry may use the same instance ID on a different server
+        if clients.get(entry.data[CONF_INSTANCE_ID]) is entry_data["client"]:
+            del clients[entry.data[CONF_INSTANCE_ID]]
+        await entry_data["client"].aclose()
+        # A reload reads storage back straight away, so nothing may be pending
+        await entry_data["storage"].async_flush()
 
         # If no more entries, unregister services
         if not hass.data[DOMAIN]:
             _async_unregister_services(hass)
+            _MEDIA_CACHE.clear()
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Delete the entry's stored data when it is removed."""
+    await EvolutionApiStorage(hass, entry.entry_id).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # The listener also fires for title/options-only updates, which don't
+    # affect the client or storage, so keep the running setup in that case
+    entry_data = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if entry_data is not None and entry_data["config"] == entry.data:
+        return
 
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
+def _log_service_errors(
+    action: str,
+) -> Callable[[_ServiceHandler], _ServiceHandler]:
+    """Log API and media resolution errors from a service handler, then re-raise."""
+
+    def decorator(func: _ServiceHandler) -> _ServiceHandler:
+        @functools.wraps(func)
+        async def wrapper(hass: HomeAssistant, call: ServiceCall) -> Any:
+            try:
+                return await func(hass, call)
+            except (EvolutionApiError, ValueError) as err:
+                _LOGGER.error("Failed to %s: %s", action, err)
+                raise
+
+        return wrapper
+
+    return decorator
+
+
+def _get_client(
+    hass: HomeAssistant, instance_id: str | None = None
+) -> EvolutionApiClient:
+    """Get the API client that should serve an instance."""
+    clients: dict[str, EvolutionApiClient] = hass.data.get(DATA_CLIENTS, {})
+    if not clients:
+        raise ValueError("No Evolution API client configured")
+    # An instance set up as its own entry is served by that entry's client,
+    # with its own server and key. Any other instance ID is sent through the
+    # first client, which addresses it by name.
+    return clients.get(instance_id) or next(iter(clients.values()))
+
+
+@_log_service_errors("send text message")
+async def _async_handle_send_text(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle send text service call."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    # The schema already renamed the fields to send_text's arguments
+    await client.send_text(**call.data)
+
+
+async def _async_send_resolved_media(
+    hass: HomeAssistant,
+    call: ServiceCall,
+    *,
+    kind: str,
+    url_attr: str,
+    client_method: str,
+) -> None:
+    """Resolve a media service's input and send it with the client method."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    # Use smart resolver for the media input
+    data = dict(call.data)
+    media_input = data[url_attr]
+    processed_media = await get_media_content(
+        hass, media_input, data.pop(ATTR_USE_URL)
+    )
+    if not processed_media:
+        raise ValueError(f"Could not resolve {kind}: {media_input}")
 
-def _get_client(hass: HomeAssistant) -> EvolutionApiClient:
-    """Get the first available API client."""
-    for entry_data in hass.data[DOMAIN].values():
-        if "client" in entry_data:
-            return entry_data["client"]
-    raise ValueError("No Evolution API client configured")
+    await getattr(client, client_method)(**{**data, url_attr: processed_media})
 
 
-async def _async_register_services(hass: HomeAssistant) -> None:
-    """Register Evolution API services."""
+# Media, audio and stickers differ only in the input field and client method
+_async_handle_send_media = _log_service_errors("send media")(
+    functools.partial(
+        _async_send_resolved_media,
+        kind="media",
+        url_attr=ATTR_MEDIA_URL,
+        client_method="send_media",
+    )
+)
+_async_handle_send_audio = _log_service_errors("send audio")(
+    functools.partial(
+        _async_send_resolved_media,
+        kind="audio",
+        url_attr=ATTR_AUDIO_URL,
+        client_method="send_audio",
+    )
+)
+_async_handle_send_sticker = _log_service_errors("send sticker")(
+    functools.partial(
+        _async_send_resolved_media,
+        kind="sticker",
+        url_attr=ATTR_STICKER_URL,
+        client_method="send_sticker",
+    )
+)
 
-    # Check if services are already registered
-    if hass.services.has_service(DOMAIN, SERVICE_SEND_TEXT):
-        return
 
-    async def async_send_text(call: ServiceCall) -> None:
-        """Handle send text service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            # Get target directly from call data
-            recipient = call.data[ATTR_TARGET]
-            
-            await client.send_text(
-                number=recipient,
-                text=call.data[ATTR_MESSAGE],
-                delay=call.data.get(ATTR_DELAY),
-                link_preview=call.data.get(ATTR_LINK_PREVIEW, True),
-                mention_all=call.data.get(ATTR_MENTION_ALL, False),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send text message: %s", err)
-            raise
+@_log_service_errors("send location")
+async def _async_handle_send_location(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle send location service call."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    await client.send_location(**call.data)
 
-    async def async_send_media(call: ServiceCall) -> None:
-        """Handle send media service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            
-            # Use smart resolver for media
-            media_input = call.data[ATTR_MEDIA_URL]
-            processed_media = await get_media_content(hass, media_input)
-            if not processed_media:
-                 raise ValueError(f"Could not resolve media: {media_input}")
-
-            await client.send_media(
-                number=recipient,
-                media_url=processed_media,
-                media_type=call.data[ATTR_MEDIA_TYPE],
-                caption=call.data.get(ATTR_MEDIA_CAPTION),
-                filename=call.data.get(ATTR_FILENAME),
-                delay=call.data.get(ATTR_DELAY),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send media: %s", err)
-            raise
-        except ValueError as err:
-            _LOGGER.error("Media resolution error: %s", err)
-            raise
-        except Exception as err:
-            _LOGGER.error("Unexpected error sending media: %s", err)
-            raise
 
-    async def async_send_audio(call: ServiceCall) -> None:
-        """Handle send audio service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            
-            # Use smart resolver for audio
-            audio_input = call.data[ATTR_AUDIO_URL]
-            processed_audio = await get_media_content(hass, audio_input)
-            if not processed_audio:
-                raise ValueError(f"Could not resolve audio: {audio_input}")
-
-            await client.send_audio(
-                number=recipient,
-                audio_url=processed_audio,
-                delay=call.data.get(ATTR_DELAY),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send audio: %s", err)
-            raise
-        except ValueError as err:
-            _LOGGER.error("Audio resolution error: %s", err)
-            raise
-        except Exception as err:
-            _LOGGER.error("Unexpected error sending audio: %s", err)
-            raise
+@_log_service_errors("send contact")
+async def _async_handle_send_contact(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle send contact service call."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    await client.send_contact(**call.data)
 
-    async def async_send_sticker(call: ServiceCall) -> None:
-        """Handle send sticker service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            
-            # Use smart resolver for sticker
-            sticker_input = call.data[ATTR_STICKER_URL]
-            processed_sticker = await get_media_content(hass, sticker_input)
-            if not processed_sticker:
-                raise ValueError(f"Could not resolve sticker: {sticker_input}")
-
-            await client.send_sticker(
-                number=recipient,
-                sticker_url=processed_sticker,
-                delay=call.data.get(ATTR_DELAY),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send sticker: %s", err)
-            raise
-        except ValueError as err:
-            _LOGGER.error("Sticker resolution error: %s", err)
-            raise
-        except Exception as err:
-            _LOGGER.error("Unexpected error sending sticker: %s", err)
-            raise
 
-    async def async_send_location(call: ServiceCall) -> None:
-        """Handle send location service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            await client.send_location(
-                number=recipient,
-                latitude=call.data[ATTR_LATITUDE],
-                longitude=call.data[ATTR_LONGITUDE],
-                name=call.data.get(ATTR_LOCATION_NAME),
-                address=call.data.get(ATTR_LOCATION_ADDRESS),
-                delay=call.data.get(ATTR_DELAY),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send location: %s", err)
-            raise
+@_log_service_errors("send reaction")
+async def _async_handle_send_reaction(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle send reaction service call."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    await client.send_reaction(**call.data)
 
-    async def async_send_contact(call: ServiceCall) -> None:
-        """Handle send contact service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            await client.send_contact(
-                number=recipient,
-                contact_name=call.data[ATTR_CONTACT_NAME],
-                contact_phone=call.data[ATTR_CONTACT_PHONE],
-                contact_email=call.data.get(ATTR_CONTACT_EMAIL),
-                contact_organization=call.data.get(ATTR_CONTACT_ORG),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send contact: %s", err)
-            raise
 
-    async def async_send_reaction(call: ServiceCall) -> None:
-        """Handle send reaction service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        try:
-            recipient = call.data[ATTR_TARGET]
-            await client.send_reaction(
-                number=recipient,
-                message_id=call.data[ATTR_MESSAGE_ID],
-                reaction=call.data[ATTR_REACTION],
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send reaction: %s", err)
-            raise
+@_log_service_errors("send poll")
+async def _async_handle_send_poll(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle send poll service call."""
+    client = _get_client(hass, call.data.get(ATTR_INSTANCE_ID))
+    await client.send_poll(**call.data)
 
-    async def async_send_poll(call: ServiceCall) -> None:
-        """Handle send poll service call."""
-        client = _get_client(hass)
-        instance = call.data.get(ATTR_INSTANCE_ID)
-        # Parse poll options from comma-separated string
-        options_str = call.data[ATTR_POLL_OPTIONS]
-        options = [opt.strip() for opt in options_str.split(",") if opt.strip()]
-        try:
-            recipient = call.data[ATTR_TARGET]
-            await client.send_poll(
-                number=recipient,
-                poll_name=call.data[ATTR_POLL_NAME],
-                options=options,
-                max_selections=call.data.get(ATTR_POLL_MAX_SELECTIONS, 1),
-                delay=call.data.get(ATTR_DELAY),
-                instance_id=instance,
-            )
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to send poll: %s", err)
-            raise
 
-    async def async_check_number(call: ServiceCall) -> dict[str, Any]:
-        """Handle check number service call."""
-        client = _get_client(hass)
-        try:
-            result = await client.check_is_whatsapp([call.data[ATTR_PHONE_NUMBER]])
-            return result
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to check number: %s", err)
-            raise
+@_log_service_errors("check number")
+async def _async_handle_check_number(hass: HomeAssistant, call: ServiceCall) -> dict[str, Any]:
+    """Handle check number service call."""
+    client = _get_client(hass)
+    # Checks from concurrent calls are sent to the API as one request
+    result = await client.check_number(call.data[ATTR_PHONE_NUMBER])
+    return result
 
-    async def async_refresh_groups(call: ServiceCall) -> None:
-        """Handle refresh groups service call."""
-        client = _get_client(hass)
-        try:
-            _LOGGER.info("Refreshing groups list")
-            groups = await client.fetch_all_groups(get_participants=False)
-            
-            # Store groups in hass.data and persistent storage for all entries
-            for entry_id, entry_data in hass.data[DOMAIN].items():
-                if "client" in entry_data:
-                    entry_data["groups"] = groups
-                    entry_data["groups_count"] = len(groups)
-                    
-                    # Save to persistent storage
-                    if "storage" in entry_data:
-                        await entry_data["storage"].async_save_groups(groups)
-                    
-                    # Fire event so sensors can update
-                    hass.bus.async_fire(
-                        f"{DOMAIN}_groups_updated",
-                        {"entry_id": entry_id, "count": len(groups)},
-                    )
-            
-            _LOGGER.info("Found %d groups", len(groups))
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to refresh groups: %s", err)
-            raise
 
-    # Register all services
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_TEXT, async_send_text, schema=SERVICE_SEND_TEXT_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_MEDIA, async_send_media, schema=SERVICE_SEND_MEDIA_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_AUDIO, async_send_audio, schema=SERVICE_SEND_AUDIO_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_STICKER, async_send_sticker, schema=SERVICE_SEND_STICKER_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_LOCATION, async_send_location, schema=SERVICE_SEND_LOCATION_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_CONTACT, async_send_contact, schema=SERVICE_SEND_CONTACT_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_REACTION, async_send_reaction, schema=SERVICE_SEND_REACTION_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_SEND_POLL, async_send_poll, schema=SERVICE_SEND_POLL_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_CHECK_NUMBER, async_check_number, schema=SERVICE_CHECK_NUMBER_SCHEMA
-    )
-    hass.services.async_register(
-        DOMAIN, SERVICE_REFRESH_GROUPS, async_refresh_groups
+@callback
+def async_store_groups(
+    hass: HomeAssistant, entry_ids: Iterable[str], groups: list[dict[str, Any]]
+) -> None:
+    """Store a fetched groups list for entries and notify their listeners."""
+    counts: dict[str, int] = {}
+    for entry_id in entry_ids:
+        entry_data = hass.data[DOMAIN][entry_id]
+        entry_data["groups"] = groups
+        entry_data["groups_count"] = len(groups)
+        counts[entry_id] = len(groups)
+
+        # Written by the store's delayed save, off the caller's path
+        if "storage" in entry_data and entry_data["storage"].set_groups(groups):
+            entry_data["storage"].async_schedule_save()
+
+    # Wake each entry's entities directly; the bus event stays for automations
+    for entry_id in counts:
+        async_dispatcher_send(hass, SIGNAL_GROUPS_UPDATED.format(entry_id))
+    hass.bus.async_fire(f"{DOMAIN}_groups_updated", {"counts": counts})
+
+
+@_log_service_errors("refresh groups")
+async def _async_handle_refresh_groups(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Handle refresh groups service call."""
+    client = _get_client(hass)
+    _LOGGER.info("Refreshing groups list")
+    groups = await client.fetch_all_groups(get_participants=False)
+
+    # Every loaded entry gets the list, whichever client fetched it
+    async_store_groups(
+        hass,
+        [
+            entry_id
+            for entry_id, entry_data in hass.data[DOMAIN].items()
+            if "client" in entry_data
+        ],
+        groups,
     )
 
+    _LOGGER.info("Found %d groups", len(groups))
+
+
+# Handler and schema for every service this integration registers
+_SERVICE_HANDLERS: dict[
+    str, tuple[_ServiceHandler, Callable[[Any], Any] | None]
+] = {
+    SERVICE_SEND_TEXT: (_async_handle_send_text, SERVICE_SEND_TEXT_SCHEMA),
+    SERVICE_SEND_MEDIA: (_async_handle_send_media, SERVICE_SEND_MEDIA_SCHEMA),
+    SERVICE_SEND_AUDIO: (_async_handle_send_audio, SERVICE_SEND_AUDIO_SCHEMA),
+    SERVICE_SEND_STICKER: (_async_handle_send_sticker, SERVICE_SEND_STICKER_SCHEMA),
+    SERVICE_SEND_LOCATION: (_async_handle_send_location, SERVICE_SEND_LOCATION_SCHEMA),
+    SERVICE_SEND_CONTACT: (_async_handle_send_contact, SERVICE_SEND_CONTACT_SCHEMA),
+    SERVICE_SEND_REACTION: (_async_handle_send_reaction, SERVICE_SEND_REACTION_SCHEMA),
+    SERVICE_SEND_POLL: (_async_handle_send_poll, SERVICE_SEND_POLL_SCHEMA),
+    SERVICE_CHECK_NUMBER: (_async_handle_check_number, SERVICE_CHECK_NUMBER_SCHEMA),
+    SERVICE_REFRESH_GROUPS: (_async_handle_refresh_groups, None),
+}
+
+
+@callback
+def _async_register_services(hass: HomeAssistant) -> None:
+    """Register Evolution API services."""
+
+    # Services are registered together, so checking the first one is enough
+    if hass.services.has_service(DOMAIN, next(iter(_SERVICE_HANDLERS))):
+        return
+
+    # Register all services
+    for service, (handler, schema) in _SERVICE_HANDLERS.items():
+        hass.services.async_register(
+            DOMAIN, service, functools.partial(handler, hass), schema=schema
+        )
+
     _LOGGER.info("Evolution API services registered")
 
 
 @callback
 def _async_unregister_services(hass: HomeAssistant) -> None:
     """Unregister Evolution API services."""
-    services = [
-        SERVICE_SEND_TEXT,
-        SERVICE_SEND_MEDIA,
-        SERVICE_SEND_AUDIO,
-        SERVICE_SEND_STICKER,
-        SERVICE_SEND_LOCATION,
-        SERVICE_SEND_CONTACT,
-        SERVICE_SEND_REACTION,
-        SERVICE_SEND_POLL,
-        SERVICE_CHECK_NUMBER,
-        SERVICE_REFRESH_GROUPS,
-    ]
-    for service in services:
+    for service in _SERVICE_HANDLERS:
         hass.services.async_remove(DOMAIN, service)
 
     _LOGGER.info("Evolution API services unregistered")
\ No newline at end of file
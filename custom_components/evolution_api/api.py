@@ -2,12 +2,28 @@
 from __future__ import annotations
 
 import asyncio
+import json
 import logging
-from typing import Any
+import random
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Iterable, Mapping
+from types import MappingProxyType
+from typing import Any, TypeVar
 
 import aiohttp
 import async_timeout
 
+try:
+    # Bundled with Home Assistant; the stdlib is a fallback for standalone use
+    from orjson import dumps as _json_dumps, loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj: Any) -> bytes:
+        """Encode a request body as JSON bytes."""
+        return json.dumps(obj).encode()
+
 from .const import (
     API_ENDPOINT_CONNECTION_STATE,
     API_ENDPOINT_FETCH_ALL_GROUPS,
@@ -32,6 +48,84 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# How long single-number checks wait to be sent together, and the batch cap
+_NUMBER_CHECK_WINDOW = 0.02
+_NUMBER_CHECK_MAX_BATCH = 64
+
+# Mimetype sent with each media type
+_MEDIA_MIMETYPES: Mapping[str, str] = MappingProxyType(
+    {
+        "image": "image/png",
+        "video": "video/mp4",
+        "document": "application/pdf",
+    }
+)
+
+# Lifetime in seconds of cached number checks and profile pictures, and the
+# number of answers kept
+_NUMBER_CHECK_TTL = 6 * 3600
+_PROFILE_PICTURE_TTL = 3600
+_CACHE_MAX_ENTRIES = 512
+
+# Default request pacing: sustained requests per second and burst size
+_DEFAULT_RATE = 10.0
+_DEFAULT_BURST = 20.0
+
+# Appended to bare phone numbers to form a user JID
+_WA_SUFFIX = "@s.whatsapp.net"
+
+# HTTP methods _request accepts
+_HTTP_METHODS = frozenset({"GET", "POST", "PUT", "DELETE"})
+
+# Retries for reads that are safe to repeat, the responses worth retrying,
+# and the backoff base and cap in seconds
+_READ_RETRIES = 2
+_RETRY_STATUSES = frozenset({502, 503, 504})
+_RETRY_BACKOFF = 0.5
+_RETRY_BACKOFF_CAP = 8.0
+
+# Connection pool bounds for a client that creates its own session
+_OWN_SESSION_LIMIT = 20
+_OWN_SESSION_LIMIT_PER_HOST = 10
+
+
+async def gather_limited(
+    coros: Iterable[Awaitable[_T]], *, limit: int = 10
+) -> list[_T | BaseException]:
+    """Await coroutines concurrently, at most `limit` at a time.
+
+    Failures are returned in place of results, as with return_exceptions.
+    """
+    semaphore = asyncio.Semaphore(limit)
+
+    async def _run(coro: Awaitable[_T]) -> _T:
+        async with semaphore:
+            return await coro
+
+    return await asyncio.gather(*(_run(coro) for coro in coros), return_exceptions=True)
+
+
+def _compact(**fields: Any) -> dict[str, Any]:
+    """Return the optional payload fields that were given a value."""
+    # Matches the API's "omit when unset" fields: falsy values are left out
+    return {key: value for key, value in fields.items() if value}
+
+
+def _match_number_results(numbers: list[str], result: Any) -> dict[str, Any]:
+    """Pair a number check response with the numbers that were sent."""
+    # The API answers with one entry per number, echoing the number sent
+    items = result if isinstance(result, list) else []
+    by_number = {
+        str(item.get("number")): item for item in items if isinstance(item, dict)
+    }
+    matched = {number: by_number[number] for number in numbers if number in by_number}
+    if len(matched) < len(numbers) and len(items) == len(numbers):
+        # Fall back to request order if the API normalized the numbers
+        matched = dict(zip(numbers, items))
+    return matched
+
 
 class EvolutionApiError(Exception):
     """Base exception for Evolution API errors."""
@@ -48,28 +142,136 @@ class EvolutionApiAuthError(EvolutionApiError):
 class EvolutionApiClient:
     """Evolution API client."""
 
+    __slots__ = (
+        "_session",
+        "_owns_session",
+        "_server_url",
+        "_instance_id",
+        "_api_key",
+        "_verify_ssl",
+        "_headers",
+        "_urls",
+        "_cache",
+        "_groups_urls",
+        "_groups_fetches",
+        "_rate",
+        "_burst",
+        "_bucket_tokens",
+        "_bucket_last",
+        "_bucket_lock",
+        "_pending_number_checks",
+        "_number_check_timer",
+        "_number_check_tasks",
+    )
+
     def __init__(
         self,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None,
         server_url: str,
         instance_id: str,
         api_key: str,
         verify_ssl: bool = True,
+        rate: float = _DEFAULT_RATE,
+        burst: float = _DEFAULT_BURST,
     ) -> None:
-        """Initialize the API client."""
+        """Initialize the API client.
+
+        Requests are paced by a token bucket refilled at `rate` per second,
+        allowing bursts of up to `burst` requests. A rate of 0 disables it.
+        """
+        # Without a session from the caller the client builds and closes its own
         self._session = session
+        self._owns_session = session is None
         self._server_url = server_url.rstrip("/")
         self._instance_id = instance_id
         self._api_key = api_key
         self._verify_ssl = verify_ssl
+        # Same for every request, so built once and shared read-only
+        self._headers: Mapping[str, str] = MappingProxyType(
+            {
+                "apikey": api_key,
+                "Content-Type": "application/json",
+            }
+        )
+        self._urls: dict[tuple[str, bool], str] = {}
+        # Slow-changing answers (number checks, profile pictures) with expiry
+        self._cache: OrderedDict[tuple[str, str], tuple[float, Any]] = OrderedDict()
+        # API requires getParticipants query parameter to be present
+        groups_url = f"{self._server_url}{API_ENDPOINT_FETCH_ALL_GROUPS}/{instance_id}"
+        self._groups_urls = {
+            flag: f"{groups_url}?getParticipants={'true' if flag else 'false'}"
+            for flag in (False, True)
+        }
+        self._groups_fetches: dict[bool, asyncio.Task] = {}
+        self._rate = rate
+        self._burst = burst
+        self._bucket_tokens = burst
+        self._bucket_last = 0.0
+        self._bucket_lock = asyncio.Lock()
+        self._pending_number_checks: list[tuple[str, asyncio.Future]] = []
+        self._number_check_timer: asyncio.TimerHandle | None = None
+        self._number_check_tasks: set[asyncio.Task] = set()
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        """Return the HTTP session, creating the client's own if it has none."""
+        if self._session is None:
+            # Bounded pool with keep-alive and cached DNS. It is created on
+            # first use so that it is bound to the running event loop.
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=_OWN_SESSION_LIMIT,
+                    limit_per_host=_OWN_SESSION_LIMIT_PER_HOST,
+                    ttl_dns_cache=300,
+                    keepalive_timeout=75,
+                )
+            )
+        return self._session
+
+    def _cache_get(self, key: tuple[str, str]) -> Any:
+        """Return a cached API answer, or None if missing or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._cache[key]
+            return None
+        self._cache.move_to_end(key)
+        return value
+
+    def _cache_set(self, key: tuple[str, str], value: Any, ttl: float) -> None:
+        """Cache an API answer for ttl seconds, evicting the oldest if full."""
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > _CACHE_MAX_ENTRIES:
+            self._cache.popitem(last=False)
+
+    async def _async_wait_for_token(self) -> None:
+        """Wait until the rate limiter allows another request."""
+        if self._rate <= 0:
+            return
+        # Waiters queue on the lock, so they are released one per token in
+        # arrival order instead of all waking at once after a sleep
+        async with self._bucket_lock:
+            loop = asyncio.get_running_loop()
+            now = loop.time()
+            self._bucket_tokens = min(
+                self._burst,
+                self._bucket_tokens + (now - self._bucket_last) * self._rate,
+            )
+            self._bucket_last = now
+            if self._bucket_tokens >= 1:
+                self._bucket_tokens -= 1
+                return
+            await asyncio.sleep((1 - self._bucket_tokens) / self._rate)
+            # The sleep refilled exactly the one token this request uses
+            self._bucket_tokens = 0
+            self._bucket_last = loop.time()
 
     @property
-    def headers(self) -> dict[str, str]:
+    def headers(self) -> Mapping[str, str]:
         """Return the headers for API requests."""
-        return {
-            "apikey": self._api_key,
-            "Content-Type": "application/json",
-        }
+        return self._headers
 
     async def _request(
         self,
@@ -78,48 +280,77 @@ class EvolutionApiClient:
         data: dict[str, Any] | None = None,
         include_instance: bool = True,
         instance_id: str | None = None, # <--- CHANGED: Added override arg
+        timeout: float = DEFAULT_TIMEOUT,
+        retries: int | None = None,
     ) -> dict[str, Any]:
-        """Make a request to the Evolution API."""
+        """Make a request to the Evolution API.
+
+        GETs retry by default; other methods may repeat a side effect, so
+        callers opt in with retries.
+        """
         
         # <--- CHANGED: Logic to use override or default instance
-        target_instance = instance_id if instance_id else self._instance_id
-        
-        if include_instance:
-            url = f"{self._server_url}{endpoint}/{target_instance}"
+        if include_instance and instance_id and instance_id != self._instance_id:
+            url = f"{self._server_url}{endpoint}/{instance_id}"
         else:
-            url = f"{self._server_url}{endpoint}"
+            # URLs for the configured instance are built once per endpoint
+            key = (endpoint, include_instance)
+            url = self._urls.get(key)
+            if url is None:
+                url = f"{self._server_url}{endpoint}"
+                if include_instance:
+                    url = f"{url}/{self._instance_id}"
+                self._urls[key] = url
         # ----------------------------------------------------
 
-        try:
-            async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                if method.upper() == "GET":
-                    async with self._session.get(
-                        url, headers=self.headers, ssl=self._verify_ssl
-                    ) as response:
-                        return await self._handle_response(response)
-                elif method.upper() == "POST":
-                    async with self._session.post(
-                        url, headers=self.headers, json=data, ssl=self._verify_ssl
-                    ) as response:
-                        return await self._handle_response(response)
-                elif method.upper() == "PUT":
-                    async with self._session.put(
-                        url, headers=self.headers, json=data, ssl=self._verify_ssl
+        if method not in _HTTP_METHODS:
+            raise ValueError(f"Unsupported HTTP method: {method}")
+
+        if retries is None:
+            retries = _READ_RETRIES if method == "GET" else 0
+
+        attempt = 0
+        while True:
+            await self._async_wait_for_token()
+            try:
+                async with async_timeout.timeout(timeout):
+                    # The body is encoded here so orjson is used whatever
+                    # serializer the session was created with
+                    async with self._get_session().request(
+                        method,
+                        url,
+                        headers=self._headers,
+                        data=None if data is None else _json_dumps(data),
+                        ssl=self._verify_ssl,
                     ) as response:
-                        return await self._handle_response(response)
-                elif method.upper() == "DELETE":
-                    async with self._session.delete(
-                        url, headers=self.headers, ssl=self._verify_ssl
-                    ) as response:
-                        return await self._handle_response(response)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-        except asyncio.TimeoutError as err:
-            _LOGGER.error("Timeout connecting to Evolution API: %s", err)
-            raise EvolutionApiConnectionError("Timeout connecting to API") from err
-        except aiohttp.ClientError as err:
-            _LOGGER.error("Error connecting to Evolution API: %s", err)
-            raise EvolutionApiConnectionError(f"Connection error: {err}") from err
+                        if (
+                            response.status not in _RETRY_STATUSES
+                            or attempt == retries
+                        ):
+                            return await self._handle_response(response)
+                        # Hand the connection back to the pool before waiting
+                        response.release()
+                        _LOGGER.debug(
+                            "Evolution API returned %s, retrying", response.status
+                        )
+            except asyncio.TimeoutError as err:
+                _LOGGER.error("Timeout connecting to Evolution API: %s", err)
+                raise EvolutionApiConnectionError("Timeout connecting to API") from err
+            except aiohttp.ClientError as err:
+                if attempt == retries:
+                    _LOGGER.error("Error connecting to Evolution API: %s", err)
+                    raise EvolutionApiConnectionError(
+                        f"Connection error: {err}"
+                    ) from err
+                _LOGGER.debug("Error connecting to Evolution API, retrying: %s", err)
+            # Jitter keeps several clients from retrying in lockstep
+            await asyncio.sleep(
+                min(
+                    _RETRY_BACKOFF * 2**attempt + random.random() * _RETRY_BACKOFF,
+                    _RETRY_BACKOFF_CAP,
+                )
+            )
+            attempt += 1
 
     async def _handle_response(
         self, response: aiohttp.ClientResponse
@@ -133,25 +364,34 @@ class EvolutionApiClient:
             text = await response.text()
             raise EvolutionApiError(f"API error {response.status}: {text}")
 
-        try:
-            return await response.json()
-        except aiohttp.ContentTypeError:
+        body = await response.read()
+        if "json" not in response.content_type:
             return {"status": response.status, "message": await response.text()}
+        # Same as response.json(): an empty body decodes to None
+        return _json_loads(body) if body.strip() else None
 
     # ==================== Instance Methods ====================
 
-    async def get_connection_state(self) -> dict[str, Any]:
+    async def get_connection_state(
+        self, timeout: float = DEFAULT_TIMEOUT
+    ) -> dict[str, Any]:
         """Get the connection state of the instance."""
-        return await self._request("GET", API_ENDPOINT_CONNECTION_STATE)
+        return await self._request(
+            "GET", API_ENDPOINT_CONNECTION_STATE, timeout=timeout
+        )
 
-    async def check_connection(self) -> bool:
+    async def check_connection(self, timeout: float = DEFAULT_TIMEOUT) -> bool:
         """Check if the instance is connected."""
         try:
-            result = await self.get_connection_state()
-            state = result.get("instance", {}).get("state", "")
-            return state.upper() == "OPEN"
+            result = await self.get_connection_state(timeout)
         except EvolutionApiError:
             return False
+        # An empty body comes back as None; anything but a state dict is "not connected"
+        instance = result.get("instance") if isinstance(result, dict) else None
+        if not isinstance(instance, dict):
+            return False
+        state = instance.get("state")
+        return isinstance(state, str) and state.upper() == "OPEN"
 
     # ==================== Message Methods ====================
 
@@ -170,18 +410,32 @@ class EvolutionApiClient:
             "number": number,
             "text": text,
             "linkPreview": link_preview,
+            **_compact(
+                delay=delay, mentionsEveryOne=mention_all, mentioned=mentioned
+            ),
         }
-        if delay:
-            payload["delay"] = delay
-        if mention_all:
-            payload["mentionsEveryOne"] = True
-        if mentioned:
-            payload["mentioned"] = mentioned
 
         _LOGGER.debug("Sending text message to %s", number)
         # <--- CHANGED: Passing instance_id
         return await self._request("POST", API_ENDPOINT_SEND_TEXT, payload, instance_id=instance_id)
 
+    async def send_text_bulk(
+        self,
+        numbers: Iterable[str],
+        text: str,
+        *,
+        concurrency: int = 10,
+        **kwargs: Any,
+    ) -> list[dict[str, Any] | BaseException]:
+        """Send the same text message to several numbers concurrently.
+
+        Returns one result per number, in order, with failures in place.
+        """
+        return await gather_limited(
+            (self.send_text(number, text, **kwargs) for number in numbers),
+            limit=concurrency,
+        )
+
     async def send_media(
         self,
         number: str,
@@ -197,21 +451,10 @@ class EvolutionApiClient:
             "number": number,
             "mediatype": media_type,
             "media": media_url,
+            # Set mimetype based on media type
+            "mimetype": _MEDIA_MIMETYPES.get(media_type, "application/octet-stream"),
+            **_compact(caption=caption, fileName=filename, delay=delay),
         }
-        if caption:
-            payload["caption"] = caption
-        if filename:
-            payload["fileName"] = filename
-        if delay:
-            payload["delay"] = delay
-
-        # Set mimetype based on media type
-        mimetype_map = {
-            "image": "image/png",
-            "video": "video/mp4",
-            "document": "application/pdf",
-        }
-        payload["mimetype"] = mimetype_map.get(media_type, "application/octet-stream")
 
         _LOGGER.debug("Sending %s to %s", media_type, number)
         return await self._request("POST", API_ENDPOINT_SEND_MEDIA, payload, instance_id=instance_id)
@@ -227,9 +470,8 @@ class EvolutionApiClient:
         payload: dict[str, Any] = {
             "number": number,
             "audio": audio_url,
+            **_compact(delay=delay),
         }
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending audio to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_AUDIO, payload, instance_id=instance_id)
@@ -245,9 +487,8 @@ class EvolutionApiClient:
         payload: dict[str, Any] = {
             "number": number,
             "sticker": sticker_url,
+            **_compact(delay=delay),
         }
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending sticker to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_STICKER, payload, instance_id=instance_id)
@@ -267,13 +508,8 @@ class EvolutionApiClient:
             "number": number,
             "latitude": latitude,
             "longitude": longitude,
+            **_compact(name=name, address=address, delay=delay),
         }
-        if name:
-            payload["name"] = name
-        if address:
-            payload["address"] = address
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending location to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_LOCATION, payload, instance_id=instance_id)
@@ -291,11 +527,8 @@ class EvolutionApiClient:
         contact: dict[str, Any] = {
             "fullName": contact_name,
             "phoneNumber": contact_phone,
+            **_compact(email=contact_email, organization=contact_organization),
         }
-        if contact_email:
-            contact["email"] = contact_email
-        if contact_organization:
-            contact["organization"] = contact_organization
 
         payload = {
             "number": number,
@@ -313,9 +546,12 @@ class EvolutionApiClient:
         instance_id: str | None = None, # <--- CHANGED
     ) -> dict[str, Any]:
         """Send a reaction to a message."""
+        # A group target is already a full JID (123...@g.us); only a phone
+        # number needs the user suffix
+        remote_jid = number if "@" in number else number + _WA_SUFFIX
         payload = {
             "key": {
-                "remoteJid": f"{number}@s.whatsapp.net",
+                "remoteJid": remote_jid,
                 "id": message_id,
             },
             "reaction": reaction,
@@ -339,9 +575,8 @@ class EvolutionApiClient:
             "name": poll_name,
             "selectableCount": max_selections,
             "values": options,
+            **_compact(delay=delay),
         }
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending poll to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_POLL, payload, instance_id=instance_id)
@@ -363,11 +598,8 @@ class EvolutionApiClient:
             "description": description,
             "buttonText": button_text,
             "sections": sections,
+            **_compact(footerText=footer, delay=delay),
         }
-        if footer:
-            payload["footerText"] = footer
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending list to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_LIST, payload)
@@ -387,22 +619,111 @@ class EvolutionApiClient:
             "title": title,
             "description": description,
             "buttons": buttons,
+            **_compact(footerText=footer, delay=delay),
         }
-        if footer:
-            payload["footerText"] = footer
-        if delay:
-            payload["delay"] = delay
 
         _LOGGER.debug("Sending buttons to %s", number)
         return await self._request("POST", API_ENDPOINT_SEND_BUTTONS, payload)
 
     # ==================== Chat Methods ====================
 
-    async def check_is_whatsapp(self, numbers: list[str]) -> dict[str, Any]:
-        """Check if phone numbers are registered on WhatsApp."""
-        payload = {"numbers": numbers}
-        _LOGGER.debug("Checking WhatsApp numbers: %s", numbers)
-        return await self._request("POST", API_ENDPOINT_CHECK_IS_WHATSAPP, payload)
+    async def check_is_whatsapp(self, numbers: list[str]) -> list[dict[str, Any]]:
+        """Check if phone numbers are registered on WhatsApp.
+
+        Answers are cached per number, so only numbers without a fresh
+        answer are sent to the API. The result has one entry per number, in
+        order; a number the API gave no answer for has "exists" set to None.
+        """
+        results = await self._async_check_numbers(numbers)
+        return [
+            results.get(number, {"number": number, "exists": None})
+            for number in numbers
+        ]
+
+    async def _async_check_numbers(
+        self, numbers: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """Return the check result for each number, in request order."""
+        results: dict[str, dict[str, Any]] = {}
+        missing: list[str] = []
+        for number in dict.fromkeys(numbers):
+            cached = self._cache_get(("check", number))
+            if cached is None:
+                missing.append(number)
+            else:
+                results[number] = cached
+
+        if missing:
+            payload = {"numbers": missing}
+            _LOGGER.debug("Checking WhatsApp numbers: %s", missing)
+            result = await self._request(
+                "POST", API_ENDPOINT_CHECK_IS_WHATSAPP, payload, retries=_READ_RETRIES
+            )
+            for number, item in _match_number_results(missing, result).items():
+                self._cache_set(("check", number), item, _NUMBER_CHECK_TTL)
+                results[number] = item
+
+        return {number: results[number] for number in numbers if number in results}
+
+    async def check_number(self, number: str) -> dict[str, Any]:
+        """Check a single number, batched with checks made around the same time."""
+        if (cached := self._cache_get(("check", number))) is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[dict[str, Any]] = loop.create_future()
+        self._pending_number_checks.append((number, future))
+        if len(self._pending_number_checks) >= _NUMBER_CHECK_MAX_BATCH:
+            self._flush_number_checks()
+        elif self._number_check_timer is None:
+            self._number_check_timer = loop.call_later(
+                _NUMBER_CHECK_WINDOW, self._flush_number_checks
+            )
+        return await future
+
+    def _flush_number_checks(self) -> None:
+        """Send the pending single-number checks as one request."""
+        if self._number_check_timer is not None:
+            self._number_check_timer.cancel()
+            self._number_check_timer = None
+        batch, self._pending_number_checks = self._pending_number_checks, []
+        if not batch:
+            return
+        task = asyncio.ensure_future(self._check_number_batch(batch))
+        self._number_check_tasks.add(task)
+        task.add_done_callback(self._number_check_tasks.discard)
+
+    async def _check_number_batch(
+        self, batch: list[tuple[str, asyncio.Future]]
+    ) -> None:
+        """Check a batch of numbers and hand each caller its own result."""
+        try:
+            results = await self._async_check_numbers([number for number, _ in batch])
+        except Exception as err:  # pylint: disable=broad-except
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(err)
+            return
+
+        for number, future in batch:
+            if future.done():
+                continue
+            if number in results:
+                future.set_result(results[number])
+            else:
+                # Without an answer the number was not checked; that is not
+                # the same as the API saying it is not on WhatsApp
+                future.set_exception(
+                    EvolutionApiError(f"No check result returned for {number}")
+                )
+
+    async def aclose(self) -> None:
+        """Finish pending number checks and close the client's own session."""
+        self._flush_number_checks()
+        if self._number_check_tasks:
+            await asyncio.gather(*self._number_check_tasks, return_exceptions=True)
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
 
     async def mark_message_as_read(
         self, remote_jid: str, message_id: str
@@ -416,7 +737,9 @@ class EvolutionApiClient:
                 }
             ]
         }
-        return await self._request("POST", API_ENDPOINT_MARK_MESSAGE_READ, payload)
+        return await self._request(
+            "POST", API_ENDPOINT_MARK_MESSAGE_READ, payload, retries=_READ_RETRIES
+        )
 
     async def send_presence(
         self, number: str, presence: str, delay: int = 1000
@@ -431,20 +754,40 @@ class EvolutionApiClient:
 
     async def fetch_profile_picture(self, number: str) -> dict[str, Any]:
         """Fetch the profile picture URL of a contact."""
+        key = ("picture", number)
+        if (cached := self._cache_get(key)) is not None:
+            return cached
         payload = {"number": number}
-        return await self._request("POST", API_ENDPOINT_FETCH_PROFILE_PICTURE, payload)
+        result = await self._request(
+            "POST", API_ENDPOINT_FETCH_PROFILE_PICTURE, payload, retries=_READ_RETRIES
+        )
+        self._cache_set(key, result, _PROFILE_PICTURE_TTL)
+        return result
 
     # ==================== Group Methods ====================
 
     async def fetch_all_groups(self, get_participants: bool = False) -> list[dict[str, Any]]:
         """Fetch all groups the instance is part of."""
-        # API requires getParticipants query parameter to be present
-        url = f"{self._server_url}{API_ENDPOINT_FETCH_ALL_GROUPS}/{self._instance_id}?getParticipants={'true' if get_participants else 'false'}"
+        # Concurrent callers (service, button) share one in-flight request
+        task = self._groups_fetches.get(get_participants)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_all_groups(get_participants))
+            self._groups_fetches[get_participants] = task
+            task.add_done_callback(
+                lambda _: self._groups_fetches.pop(get_participants, None)
+            )
+        # Shield so one cancelled caller doesn't cancel the fetch for the others
+        return await asyncio.shield(task)
+
+    async def _fetch_all_groups(self, get_participants: bool) -> list[dict[str, Any]]:
+        """Request the group list from the API."""
+        url = self._groups_urls[get_participants]
         
+        await self._async_wait_for_token()
         try:
             async with async_timeout.timeout(DEFAULT_TIMEOUT):
-                async with self._session.get(
-                    url, headers=self.headers, ssl=self._verify_ssl
+                async with self._get_session().get(
+                    url, headers=self._headers, ssl=self._verify_ssl
                 ) as response:
                     result = await self._handle_response(response)
                     # API returns a list directly
@@ -460,24 +803,55 @@ class EvolutionApiClient:
     async def fetch_profile(self, number: str) -> dict[str, Any]:
         """Fetch profile information for a number."""
         payload = {"number": number}
-        return await self._request("POST", API_ENDPOINT_FETCH_PROFILE, payload)
+        return await self._request(
+            "POST", API_ENDPOINT_FETCH_PROFILE, payload, retries=_READ_RETRIES
+        )
 
     async def get_instance_info(self) -> dict[str, Any]:
         """Get comprehensive instance information."""
         try:
             connection_state = await self.get_connection_state()
             instance_data = connection_state.get("instance", {})
-            
+            owner = instance_data.get("owner") or ""
             return {
                 "state": instance_data.get("state", "unknown"),
-                "owner": instance_data.get("owner", ""),
+                "owner": owner,
                 "profile_name": instance_data.get("profileName", ""),
                 "profile_picture_url": instance_data.get("profilePictureUrl", ""),
-                "phone_number": instance_data.get("owner", "").replace("@s.whatsapp.net", ""),
+                "phone_number": owner.partition("@")[0],
             }
         except EvolutionApiError as err:
             _LOGGER.error("Error getting instance info: %s", err)
             return {
                 "state": "error",
                 "error": str(err),
-            }
\ No newline at end of file
+            }
+
+    async def get_instance_info_full(self, owner: str | None = None) -> dict[str, Any]:
+        """Get instance information with the owner's current profile picture.
+
+        The owner is only known from the state response; a caller that already
+        knows it can pass it so the picture is fetched alongside the state.
+        """
+        known_owner = owner or ""
+        if known_owner:
+            info, picture = await asyncio.gather(
+                self.get_instance_info(), self._fetch_picture_or_empty(known_owner)
+            )
+        else:
+            info, picture = await self.get_instance_info(), {}
+
+        current_owner = info.get("owner")
+        if current_owner and current_owner != known_owner:
+            picture = await self._fetch_picture_or_empty(current_owner)
+        if url := picture.get("profilePictureUrl"):
+            info = {**info, "profile_picture_url": url}
+        return info
+
+    async def _fetch_picture_or_empty(self, number: str) -> dict[str, Any]:
+        """Fetch a profile picture, treating a failure as no picture."""
+        try:
+            return await self.fetch_profile_picture(number) or {}
+        except EvolutionApiError as err:
+            _LOGGER.debug("Error fetching profile picture: %s", err)
+            return {}
\ No newline at end of file
@@ -7,9 +7,9 @@ from typing import Any
 from homeassistant.components.button import ButtonEntity, ButtonDeviceClass
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from . import async_store_groups
 from .api import EvolutionApiClient, EvolutionApiError
 from .const import CONF_INSTANCE_ID, CONF_SERVER_URL, DOMAIN
 
@@ -53,17 +53,9 @@ class EvolutionApiButtonBase(ButtonEntity):
         self._entry = entry
         self._instance_id = instance_id
         self._server_url = server_url
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"Evolution API ({self._instance_id})",
-            manufacturer="Evolution API",
-            model="WhatsApp Instance",
-            configuration_url=self._server_url,
-        )
+        # The entry's dict in hass.data lives as long as the entry is loaded
+        self._entry_data: dict[str, Any] = hass.data[DOMAIN][entry.entry_id]
+        self._attr_device_info = self._entry_data["device_info"]
 
 
 class RefreshGroupsButton(EvolutionApiButtonBase):
@@ -89,23 +81,7 @@ class RefreshGroupsButton(EvolutionApiButtonBase):
         try:
             _LOGGER.info("Refreshing groups for instance %s", self._instance_id)
             groups = await self._client.fetch_all_groups(get_participants=False)
-            
-            entry_data = self.hass.data[DOMAIN][self._entry.entry_id]
-            
-            # Store groups in hass.data for other entities to use
-            entry_data["groups"] = groups
-            entry_data["groups_count"] = len(groups)
-            
-            # Save to persistent storage
-            if "storage" in entry_data:
-                await entry_data["storage"].async_save_groups(groups)
-            
-            # Fire event so other entities can update
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_groups_updated",
-                {"entry_id": self._entry.entry_id, "count": len(groups)},
-            )
-            
+            async_store_groups(self.hass, [self._entry.entry_id], groups)
             _LOGGER.info("Found %d groups for instance %s", len(groups), self._instance_id)
         except EvolutionApiError as err:
             _LOGGER.error("Failed to refresh groups: %s", err)
@@ -132,19 +108,14 @@ class RefreshConnectionButton(EvolutionApiButtonBase):
 
     async def async_press(self) -> None:
         """Handle the button press."""
-        try:
-            _LOGGER.info("Refreshing connection for instance %s", self._instance_id)
-            info = await self._client.get_instance_info()
-            
-            # Store info in hass.data
-            self.hass.data[DOMAIN][self._entry.entry_id]["instance_info"] = info
-            
-            # Fire event so sensor can update
-            self.hass.bus.async_fire(
-                f"{DOMAIN}_connection_updated",
-                {"entry_id": self._entry.entry_id, "state": info.get("state")},
+        _LOGGER.info("Refreshing connection for instance %s", self._instance_id)
+        # The coordinator updates the connection sensor and coalesces presses
+        # with its own scheduled polls
+        coordinator = self._entry_data["coordinator"]
+        await coordinator.async_request_refresh()
+        if coordinator.last_update_success:
+            _LOGGER.info("Connection state: %s", coordinator.data.get("state"))
+        else:
+            _LOGGER.error(
+                "Failed to refresh connection: %s", coordinator.last_exception
             )
-            
-            _LOGGER.info("Connection state: %s", info.get("state"))
-        except EvolutionApiError as err:
-            _LOGGER.error("Failed to refresh connection: %s", err)
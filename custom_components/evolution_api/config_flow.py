@@ -1,6 +1,7 @@
 """Config flow for Evolution API integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Any
 
@@ -26,42 +27,28 @@ from .const import (
     CONF_VERIFY_SSL,
     DEFAULT_VERIFY_SSL,
     DOMAIN,
+    PROBE_TIMEOUT,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
 
-def get_user_data_schema(
-    defaults: dict[str, Any] | None = None
-) -> vol.Schema:
-    """Get the schema for user data with optional defaults."""
-    defaults = defaults or {}
-    return vol.Schema(
-        {
-            vol.Required(
-                CONF_SERVER_URL,
-                default=defaults.get(CONF_SERVER_URL, ""),
-            ): TextSelector(
-                TextSelectorConfig(type=TextSelectorType.URL)
-            ),
-            vol.Required(
-                CONF_INSTANCE_ID,
-                default=defaults.get(CONF_INSTANCE_ID, ""),
-            ): TextSelector(
-                TextSelectorConfig(type=TextSelectorType.TEXT)
-            ),
-            vol.Required(
-                CONF_API_KEY,
-                default=defaults.get(CONF_API_KEY, ""),
-            ): TextSelector(
-                TextSelectorConfig(type=TextSelectorType.PASSWORD)
-            ),
-            vol.Optional(
-                CONF_VERIFY_SSL,
-                default=defaults.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
-            ): BooleanSelector(),
-        }
-    )
+# Defaults for an existing entry or a retried form are filled in with
+# add_suggested_values_to_schema, so the schema itself is built once
+USER_DATA_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_SERVER_URL): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.URL)
+        ),
+        vol.Required(CONF_INSTANCE_ID): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.TEXT)
+        ),
+        vol.Required(CONF_API_KEY): TextSelector(
+            TextSelectorConfig(type=TextSelectorType.PASSWORD)
+        ),
+        vol.Optional(CONF_VERIFY_SSL, default=DEFAULT_VERIFY_SSL): BooleanSelector(),
+    }
+)
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -96,13 +83,22 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     errors["base"] = "instance_not_connected"
                 else:
                     errors["base"] = "cannot_connect"
-            except Exception:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected exception")
-                errors["base"] = "unknown"
+            except (
+                aiohttp.ClientError,
+                EvolutionApiError,
+                asyncio.TimeoutError,
+                ValueError,
+            ) as err:
+                _LOGGER.debug("Error validating Evolution API connection: %s", err)
+                errors["base"] = "cannot_connect"
 
         return self.async_show_form(
             step_id="user",
-            data_schema=get_user_data_schema(user_input),
+            data_schema=(
+                self.add_suggested_values_to_schema(USER_DATA_SCHEMA, user_input)
+                if user_input
+                else USER_DATA_SCHEMA
+            ),
             errors=errors,
             description_placeholders={
                 "docs_url": "https://doc.evolution-api.com/v2/api-reference"
@@ -111,27 +107,28 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     async def _test_connection(self, user_input: dict[str, Any]) -> str:
         """Test if we can connect to the Evolution API."""
-        session = async_get_clientsession(self.hass)
+        verify_ssl = user_input.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+        session = async_get_clientsession(self.hass, verify_ssl=verify_ssl)
         client = EvolutionApiClient(
             session=session,
             server_url=user_input[CONF_SERVER_URL],
             instance_id=user_input[CONF_INSTANCE_ID],
             api_key=user_input[CONF_API_KEY],
-            verify_ssl=user_input.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+            verify_ssl=verify_ssl,
         )
 
         try:
-            is_connected = await client.check_connection()
+            is_connected = await client.check_connection(timeout=PROBE_TIMEOUT)
             if is_connected:
                 return "success"
             return "not_connected"
         except EvolutionApiAuthError:
             return "auth_error"
         except EvolutionApiError as err:
-            _LOGGER.error("Error connecting to Evolution API: %s", err)
+            _LOGGER.debug("Error connecting to Evolution API: %s", err)
             return "connection_error"
         except aiohttp.ClientError as err:
-            _LOGGER.error("Client error connecting to Evolution API: %s", err)
+            _LOGGER.debug("Client error connecting to Evolution API: %s", err)
             return "connection_error"
 
     @staticmethod
@@ -161,17 +158,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
             new_data = {**self.config_entry.data, **user_input}
             
             # Test connection with new settings
-            session = async_get_clientsession(self.hass)
+            verify_ssl = new_data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL)
+            session = async_get_clientsession(self.hass, verify_ssl=verify_ssl)
             client = EvolutionApiClient(
                 session=session,
                 server_url=new_data[CONF_SERVER_URL],
                 instance_id=new_data[CONF_INSTANCE_ID],
                 api_key=new_data[CONF_API_KEY],
-                verify_ssl=new_data.get(CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL),
+                verify_ssl=verify_ssl,
             )
 
             try:
-                is_connected = await client.check_connection()
+                is_connected = await client.check_connection(timeout=PROBE_TIMEOUT)
                 if is_connected:
                     # Update the config entry data
                     self.hass.config_entries.async_update_entry(
@@ -182,47 +180,19 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                 errors["base"] = "instance_not_connected"
             except EvolutionApiAuthError:
                 errors["base"] = "invalid_auth"
-            except EvolutionApiError as err:
-                _LOGGER.error("Evolution API error: %s", err)
-                errors["base"] = "cannot_connect"
-            except Exception as err:  # pylint: disable=broad-except
-                _LOGGER.exception("Unexpected error in options flow: %s", err)
+            except (
+                aiohttp.ClientError,
+                EvolutionApiError,
+                asyncio.TimeoutError,
+                ValueError,
+            ) as err:
+                _LOGGER.debug("Evolution API error: %s", err)
                 errors["base"] = "cannot_connect"
 
         # Show form with current values
-        try:
-            defaults = self.config_entry.data
-            schema = vol.Schema(
-                {
-                    vol.Required(
-                        CONF_SERVER_URL,
-                        default=defaults.get(CONF_SERVER_URL, ""),
-                    ): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.URL)
-                    ),
-                    vol.Required(
-                        CONF_INSTANCE_ID,
-                        default=defaults.get(CONF_INSTANCE_ID, ""),
-                    ): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.TEXT)
-                    ),
-                    vol.Required(
-                        CONF_API_KEY,
-                        default=defaults.get(CONF_API_KEY, ""),
-                    ): TextSelector(
-                        TextSelectorConfig(type=TextSelectorType.PASSWORD)
-                    ),
-                    vol.Optional(
-                        CONF_VERIFY_SSL,
-                        default=defaults.get(
-                            CONF_VERIFY_SSL, DEFAULT_VERIFY_SSL
-                        ),
-                    ): BooleanSelector(),
-                }
-            )
-        except Exception:
-            # Fallback if config is malformed
-            return self.async_abort(reason="unknown")
+        schema = self.add_suggested_values_to_schema(
+            USER_DATA_SCHEMA, self.config_entry.data
+        )
 
         return self.async_show_form(
             step_id="init",
@@ -4,6 +4,13 @@ from typing import Final
 # Integration domain - used as the key for storing data in hass.data
 DOMAIN: Final = "evolution_api"
 
+# hass.data key for the API clients of all entries, keyed by instance ID
+DATA_CLIENTS: Final = f"{DOMAIN}_clients"
+
+# Dispatcher signal sent when an entry's groups list changes; format with the
+# entry ID so only that entry's entities are woken
+SIGNAL_GROUPS_UPDATED: Final = f"{DOMAIN}_groups_updated_{{}}"
+
 # Configuration keys
 CONF_INSTANCE_ID: Final = "instance_id"
 CONF_API_KEY: Final = "api_key"
@@ -15,6 +22,8 @@ DEFAULT_NAME: Final = "Evolution API"
 DEFAULT_PORT: Final = 3000
 DEFAULT_VERIFY_SSL: Final = True
 DEFAULT_TIMEOUT: Final = 30
+# Shorter timeout for connection checks while the user waits in a flow
+PROBE_TIMEOUT: Final = 8
 
 # API endpoints - Instance Management
 API_ENDPOINT_GET_INFO: Final = "/"
@@ -80,6 +89,7 @@ ATTR_MEDIA_CAPTION: Final = "caption"
 ATTR_FILENAME: Final = "filename"
 ATTR_AUDIO_URL: Final = "audio_url"
 ATTR_STICKER_URL: Final = "sticker_url"
+ATTR_USE_URL: Final = "use_url"
 ATTR_LATITUDE: Final = "latitude"
 ATTR_LONGITUDE: Final = "longitude"
 ATTR_LOCATION_NAME: Final = "name"
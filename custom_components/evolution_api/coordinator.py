@@ -0,0 +1,46 @@
+"""Data update coordinator for the Evolution API integration."""
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+
+from .api import EvolutionApiClient, EvolutionApiError
+
+_LOGGER = logging.getLogger(__name__)
+
+SCAN_INTERVAL = timedelta(minutes=1)
+
+
+class EvolutionApiCoordinator(DataUpdateCoordinator):
+    """Coordinator to manage Evolution API data updates."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: EvolutionApiClient,
+        instance_id: str,
+    ) -> None:
+        """Initialize the coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"Evolution API {instance_id}",
+            update_interval=SCAN_INTERVAL,
+        )
+        self.client = client
+        self.instance_id = instance_id
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Fetch data from Evolution API."""
+        try:
+            connection_state = await self.client.get_connection_state()
+            return {
+                "state": connection_state.get("instance", {}).get("state", "unknown"),
+                "instance": connection_state.get("instance", {}),
+            }
+        except EvolutionApiError as err:
+            raise UpdateFailed(f"Error communicating with API: {err}") from err
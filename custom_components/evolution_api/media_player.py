@@ -2,7 +2,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.media_player import (
     MediaPlayerEntity,
@@ -12,16 +12,20 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 # Import the helper from your existing __init__.py
 from . import get_media_content
 from .api import EvolutionApiClient, EvolutionApiError
 from .const import CONF_INSTANCE_ID, CONF_SERVER_URL, DOMAIN
+from .coordinator import EvolutionApiCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Media types this player accepts; anything else is still sent as audio
+_SUPPORTED_MEDIA_TYPES: Final = frozenset({"music", "audio", "voice", "sound"})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -29,16 +33,22 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Evolution API media player."""
-    client: EvolutionApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    client: EvolutionApiClient = entry_data["client"]
+    coordinator: EvolutionApiCoordinator = entry_data["coordinator"]
     instance_id = entry.data[CONF_INSTANCE_ID]
     server_url = entry.data[CONF_SERVER_URL]
 
     async_add_entities(
-        [EvolutionApiMediaPlayer(hass, client, entry, instance_id, server_url)]
+        [
+            EvolutionApiMediaPlayer(
+                hass, client, coordinator, entry, instance_id, server_url
+            )
+        ]
     )
 
 
-class EvolutionApiMediaPlayer(MediaPlayerEntity):
+class EvolutionApiMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     """Representation of the Evolution API Instance as a Media Player."""
 
     _attr_has_entity_name = True
@@ -51,37 +61,30 @@ class EvolutionApiMediaPlayer(MediaPlayerEntity):
         self,
         hass: HomeAssistant,
         client: EvolutionApiClient,
+        coordinator: EvolutionApiCoordinator,
         entry: ConfigEntry,
         instance_id: str,
         server_url: str,
     ) -> None:
         """Initialize the media player."""
+        super().__init__(coordinator)
         self.hass = hass
         self._client = client
         self._entry = entry
         self._default_instance_id = instance_id
         self._server_url = server_url
+        self._attr_device_info = hass.data[DOMAIN][entry.entry_id]["device_info"]
         self._attr_unique_id = f"{entry.entry_id}_mediaplayer"
-        self._attr_state = MediaPlayerState.IDLE
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"Evolution API ({self._default_instance_id})",
-            manufacturer="Evolution API",
-            model="WhatsApp Instance",
-            configuration_url=self._server_url,
-        )
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the device."""
-        return self._attr_state
-
-    # Supported media types for audio sending
-    SUPPORTED_MEDIA_TYPES = {"music", "audio", "voice", "sound"}
+        # Follows the connection state polled for the sensor; sending is a
+        # push, so a connected instance is always idle
+        data = self.coordinator.data
+        if data and data.get("state", "").lower() == "open":
+            return MediaPlayerState.IDLE
+        return MediaPlayerState.OFF
 
     async def async_play_media(
         self, media_type: str, media_id: str, **kwargs: Any
@@ -97,11 +100,16 @@ class EvolutionApiMediaPlayer(MediaPlayerEntity):
             - instance_id: Override the default Evolution API instance
         """
         # Validate media_type (warn but proceed for flexibility)
-        if media_type and media_type.lower() not in self.SUPPORTED_MEDIA_TYPES:
+        # Checked as given first so the usual lowercase type skips .lower()
+        if (
+            media_type
+            and media_type not in _SUPPORTED_MEDIA_TYPES
+            and media_type.lower() not in _SUPPORTED_MEDIA_TYPES
+        ):
             _LOGGER.warning(
                 "Media type '%s' is not in supported types %s. "
                 "This media player only sends audio to WhatsApp. Proceeding anyway.",
-                media_type, self.SUPPORTED_MEDIA_TYPES
+                media_type, sorted(_SUPPORTED_MEDIA_TYPES)
             )
         
         # 1. Extract Target & Instance from 'extra' data
@@ -120,8 +128,6 @@ class EvolutionApiMediaPlayer(MediaPlayerEntity):
             "Sending audio to %s via instance %s (media_type: %s)", 
             target, instance_override or self._default_instance_id, media_type
         )
-        self._attr_state = MediaPlayerState.PLAYING
-        self.async_write_ha_state()
 
         try:
             # 2. Resolve the media (handle local files, TTS URLs, media-source://)
@@ -129,8 +135,6 @@ class EvolutionApiMediaPlayer(MediaPlayerEntity):
             
             if not processed_audio:
                 _LOGGER.error("Failed to process audio URL: %s", media_id)
-                self._attr_state = MediaPlayerState.IDLE
-                self.async_write_ha_state()
                 return
 
             # 3. Send via API (passing target, audio, and optional instance override)
@@ -141,15 +145,18 @@ class EvolutionApiMediaPlayer(MediaPlayerEntity):
             )
         except EvolutionApiError as err:
             _LOGGER.error("Failed to send audio via media player: %s", err)
-            self._attr_state = MediaPlayerState.IDLE
-            self.async_write_ha_state()
             return
         except Exception as err:
             _LOGGER.error("Unexpected error in media player: %s", err)
-            self._attr_state = MediaPlayerState.IDLE
-            self.async_write_ha_state()
             return
 
-        # Return to idle immediately as it's a push operation
-        self._attr_state = MediaPlayerState.IDLE
-        self.async_write_ha_state()
\ No newline at end of file
+        # Sending is a push with no playback to track, so the player stays
+        # idle and an event marks the send instead of two state writes
+        self.hass.bus.async_fire(
+            f"{DOMAIN}_audio_sent",
+            {
+                "entity_id": self.entity_id,
+                "target": target,
+                "instance_id": instance_override or self._default_instance_id,
+            },
+        )
\ No newline at end of file
@@ -2,7 +2,8 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from collections.abc import Mapping, Sequence
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,20 +13,17 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant, callback
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import EvolutionApiClient, EvolutionApiError
-from .const import CONF_INSTANCE_ID, CONF_SERVER_URL, DOMAIN
+from .const import CONF_INSTANCE_ID, CONF_SERVER_URL, DOMAIN, SIGNAL_GROUPS_UPDATED
+from .coordinator import EvolutionApiCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-SCAN_INTERVAL = timedelta(minutes=1)
+# Lowercased connection states; the API only reports a handful of them
+_STATE_LOWER: dict[str, str] = {}
 
 
 async def async_setup_entry(
@@ -34,13 +32,12 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up Evolution API sensor based on a config entry."""
-    client: EvolutionApiClient = hass.data[DOMAIN][entry.entry_id]["client"]
+    coordinator: EvolutionApiCoordinator = hass.data[DOMAIN][entry.entry_id][
+        "coordinator"
+    ]
     instance_id = entry.data[CONF_INSTANCE_ID]
     server_url = entry.data[CONF_SERVER_URL]
 
-    coordinator = EvolutionApiCoordinator(hass, client, instance_id)
-    await coordinator.async_config_entry_first_refresh()
-
     async_add_entities(
         [
             EvolutionApiConnectionSensor(coordinator, entry, instance_id, server_url),
@@ -49,37 +46,6 @@ async def async_setup_entry(
     )
 
 
-class EvolutionApiCoordinator(DataUpdateCoordinator):
-    """Coordinator to manage Evolution API data updates."""
-
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        client: EvolutionApiClient,
-        instance_id: str,
-    ) -> None:
-        """Initialize the coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=f"Evolution API {instance_id}",
-            update_interval=SCAN_INTERVAL,
-        )
-        self.client = client
-        self.instance_id = instance_id
-
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from Evolution API."""
-        try:
-            connection_state = await self.client.get_connection_state()
-            return {
-                "state": connection_state.get("instance", {}).get("state", "unknown"),
-                "instance": connection_state.get("instance", {}),
-            }
-        except EvolutionApiError as err:
-            raise UpdateFailed(f"Error communicating with API: {err}") from err
-
-
 class EvolutionApiConnectionSensor(CoordinatorEntity, SensorEntity):
     """Sensor showing the connection status of the WhatsApp instance."""
 
@@ -100,42 +66,44 @@ class EvolutionApiConnectionSensor(CoordinatorEntity, SensorEntity):
         self._instance_id = instance_id
         self._server_url = server_url
         self._entry = entry
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"Evolution API ({self._instance_id})",
-            manufacturer="Evolution API",
-            model="WhatsApp Instance",
-            configuration_url=self._server_url,
+        self._attr_device_info = coordinator.hass.data[DOMAIN][entry.entry_id][
+            "device_info"
+        ]
+        self._base_attributes: Mapping[str, Any] = MappingProxyType(
+            {"instance_id": instance_id, "server_url": server_url}
         )
+        self._attributes: tuple[dict[str, Any], dict[str, Any]] | None = None
 
     @property
     def native_value(self) -> str:
         """Return the state of the sensor."""
-        if self.coordinator.data:
-            state = self.coordinator.data.get("state", "unknown")
-            return state.lower()
-        return "unknown"
+        data = self.coordinator.data
+        if not data:
+            return "unknown"
+        state = data.get("state", "unknown")
+        if (lowered := _STATE_LOWER.get(state)) is None:
+            lowered = _STATE_LOWER[state] = state.lower()
+        return lowered
 
     @property
-    def extra_state_attributes(self) -> dict[str, Any]:
+    def extra_state_attributes(self) -> Mapping[str, Any]:
         """Return extra state attributes."""
-        if self.coordinator.data:
-            instance_data = self.coordinator.data.get("instance", {})
-            return {
-                "instance_id": self._instance_id,
-                "server_url": self._server_url,
-                "owner": instance_data.get("owner", ""),
-                "profile_name": instance_data.get("profileName", ""),
-                "profile_picture": instance_data.get("profilePictureUrl", ""),
-            }
-        return {
-            "instance_id": self._instance_id,
-            "server_url": self._server_url,
-        }
+        data = self.coordinator.data
+        if not data:
+            return self._base_attributes
+        # Built once per coordinator update rather than on every read
+        if self._attributes is None or self._attributes[0] is not data:
+            instance_data = data.get("instance", {})
+            self._attributes = (
+                data,
+                {
+                    **self._base_attributes,
+                    "owner": instance_data.get("owner", ""),
+                    "profile_name": instance_data.get("profileName", ""),
+                    "profile_picture": instance_data.get("profilePictureUrl", ""),
+                },
+            )
+        return self._attributes[1]
 
     @property
     def available(self) -> bool:
@@ -164,17 +132,23 @@ class EvolutionApiGroupsSensor(SensorEntity):
         self._instance_id = instance_id
         self._server_url = server_url
         self._entry = entry
-        self._groups: list[dict[str, Any]] = []
+        self._attr_device_info = hass.data[DOMAIN][entry.entry_id]["device_info"]
+        # The fetched list, or the read-only view loaded from storage
+        self._groups: Sequence[Mapping[str, Any]] = []
         self._last_updated: str | None = None
+        self._groups_attribute: tuple[
+            Sequence[Mapping[str, Any]], list[dict[str, Any]]
+        ] | None = None
 
     async def async_added_to_hass(self) -> None:
         """Run when entity about to be added to hass."""
         await super().async_added_to_hass()
         
-        # Listen for groups update events
+        # Listen for this entry's groups updates
         self.async_on_remove(
-            self.hass.bus.async_listen(
-                f"{DOMAIN}_groups_updated",
+            async_dispatcher_connect(
+                self.hass,
+                SIGNAL_GROUPS_UPDATED.format(self._entry.entry_id),
                 self._handle_groups_updated,
             )
         )
@@ -194,26 +168,22 @@ class EvolutionApiGroupsSensor(SensorEntity):
             self._groups = entry_data["groups"]
 
     @callback
-    def _handle_groups_updated(self, event) -> None:
-        """Handle groups updated event."""
-        if event.data.get("entry_id") == self._entry.entry_id:
-            entry_data = self.hass.data[DOMAIN][self._entry.entry_id]
-            self._groups = entry_data.get("groups", [])
-            # Update last_updated from storage
-            if "storage" in entry_data:
-                self._last_updated = entry_data["storage"].get_groups_last_updated()
-            self.async_write_ha_state()
-
-    @property
-    def device_info(self) -> DeviceInfo:
-        """Return device information."""
-        return DeviceInfo(
-            identifiers={(DOMAIN, self._entry.entry_id)},
-            name=f"Evolution API ({self._instance_id})",
-            manufacturer="Evolution API",
-            model="WhatsApp Instance",
-            configuration_url=self._server_url,
-        )
+    def _handle_groups_updated(self) -> None:
+        """Handle groups updated signal."""
+        entry_data = self.hass.data[DOMAIN][self._entry.entry_id]
+        groups = entry_data.get("groups", [])
+        # A signal without a new list (same list, or the same group objects)
+        # has nothing to write
+        if groups is self._groups or (
+            len(groups) == len(self._groups)
+            and all(new is old for new, old in zip(groups, self._groups))
+        ):
+            return
+        self._groups = groups
+        # Update last_updated from storage
+        if "storage" in entry_data:
+            self._last_updated = entry_data["storage"].get_groups_last_updated()
+        self.async_write_ha_state()
 
     @property
     def native_value(self) -> int:
@@ -223,17 +193,21 @@ class EvolutionApiGroupsSensor(SensorEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return extra state attributes."""
-        # Return simplified group list as attribute
-        groups_list = []
-        for group in self._groups[:50]:  # Limit to 50 groups to avoid huge attributes
-            groups_list.append({
-                "id": group.get("id", ""),
-                "name": group.get("subject", ""),
-                "participants": group.get("size", 0),
-            })
-        
+        # Return simplified group list as attribute, rebuilt only when a new
+        # list has been loaded or received
+        if self._groups_attribute is None or self._groups_attribute[0] is not self._groups:
+            groups_list = [
+                {
+                    "id": group.get("id", ""),
+                    "name": group.get("subject", ""),
+                    "participants": group.get("size", 0),
+                }
+                for group in self._groups[:50]  # Limit to 50 groups to avoid huge attributes
+            ]
+            self._groups_attribute = (self._groups, groups_list)
+
         return {
-            "groups": groups_list,
+            "groups": self._groups_attribute[1],
             "total_groups": len(self._groups),
             "last_updated": self._last_updated or "Never",
         }
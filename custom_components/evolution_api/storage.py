@@ -1,39 +1,193 @@
 """Persistent storage for Evolution API integration."""
 from __future__ import annotations
 
+import asyncio
+import gzip
 import logging
+import os
+import time
+from collections.abc import Mapping
 from datetime import datetime
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, CoreState, HomeAssistant, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.helpers.start import async_at_started
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
+from homeassistant.util.json import json_loads
 
 from .const import DOMAIN
 
 _LOGGER = logging.getLogger(__name__)
 
-STORAGE_VERSION = 1
+STORAGE_VERSION = 2
 STORAGE_KEY = f"{DOMAIN}_data"
+# Groups are kept out of the Store in a compressed file of their own
+GROUPS_FILE_SUFFIX = "groups.json.gz"
+# Seconds to wait before writing, so bursts of updates share one write
+SAVE_DELAY = 10
+# Minimum seconds between writes caused by connection state changes, so a
+# flapping connection cannot keep the disk busy
+CONNECTION_SAVE_INTERVAL = 30
+
+# Immutable part of a new entry's data
+_DEFAULT_DATA: Final[Mapping[str, Any]] = MappingProxyType(
+    {
+        "groups_count": 0,
+        "groups_last_updated": None,
+        "connection_state": "unknown",
+        "connection_last_updated": None,
+    }
+)
+
+
+def _groups_to_columns(groups: list[dict[str, Any]]) -> dict[str, Any]:
+    """Store groups column-wise so each key is written once, not per group.
+
+    The rows that lack a key are listed under "missing", which keeps an
+    absent key apart from one stored as None.
+    """
+    keys: dict[str, None] = {}
+    for group in groups:
+        keys.update(dict.fromkeys(group))
+    columns: dict[str, list[Any]] = {}
+    missing: dict[str, list[int]] = {}
+    for key in keys:
+        columns[key] = [group.get(key) for group in groups]
+        if absent := [index for index, group in enumerate(groups) if key not in group]:
+            missing[key] = absent
+    return {"count": len(groups), "columns": columns, "missing": missing}
+
+
+def _columns_to_groups(data: dict[str, Any]) -> list[dict[str, Any]]:
+    """Rebuild the group dicts, leaving out keys a group did not have."""
+    groups: list[dict[str, Any]] = [{} for _ in range(data.get("count", 0))]
+    missing = data.get("missing", {})
+    for key, values in data.get("columns", {}).items():
+        absent = set(missing.get(key, ()))
+        for index, (group, value) in enumerate(zip(groups, values)):
+            if index not in absent:
+                group[key] = value
+    return groups
+
+
+def _dedupe_strings(data: dict[str, Any]) -> dict[str, Any]:
+    """Share one object per distinct string value across the loaded groups.
+
+    Decoding creates a new string for every occurrence, while owners and
+    similar fields repeat across many groups.
+    """
+    seen: dict[str, str] = {}
+    for values in data.get("columns", {}).values():
+        for index, value in enumerate(values):
+            if isinstance(value, str):
+                values[index] = seen.setdefault(value, value)
+    return data
+
+
+class _EvolutionApiStore(Store):
+    """Store that migrates older storage files."""
+
+    async def _async_migrate_func(
+        self,
+        old_major_version: int,
+        old_minor_version: int,
+        old_data: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Migrate to the current storage version."""
+        if old_major_version == 1:
+            # Version 1 stored groups as a list of dicts
+            old_data = dict(old_data)
+            old_data["groups_columns"] = _groups_to_columns(old_data.pop("groups", []))
+        return old_data
 
 
 class EvolutionApiStorage:
     """Handle persistent storage for Evolution API data."""
 
+    __slots__ = (
+        "hass",
+        "entry_id",
+        "_store",
+        "_data",
+        "_loaded",
+        "_version",
+        "_saved_version",
+        "_pending_stamps",
+        "_groups",
+        "_groups_view",
+        "_instance_info_view",
+        "_groups_dirty",
+        "_groups_columns",
+        "_groups_path",
+        "_groups_pending",
+        "_groups_writer",
+        "_start_unsub",
+        "_last_write",
+        "_state_flush",
+    )
+
     def __init__(self, hass: HomeAssistant, entry_id: str) -> None:
         """Initialize storage."""
         self.hass = hass
         self.entry_id = entry_id
-        self._store = Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}")
+        self._store = _EvolutionApiStore(
+            hass, STORAGE_VERSION, f"{STORAGE_KEY}_{entry_id}"
+        )
         self._data: dict[str, Any] = {}
         self._loaded = False
+        # Bumped by every change; a save is skipped when the last write
+        # already covered the current version
+        self._version = 0
+        self._saved_version = 0
+        # Update times are recorded as epoch seconds and only formatted as
+        # ISO strings when they are read or written
+        self._pending_stamps: dict[str, float] = {}
+        # Groups as dicts, rebuilt from the side file's columns on first
+        # read; the file is only rewritten after the list changes
+        self._groups: list[dict[str, Any]] | None = None
+        # Read-only views handed to callers, built once per change
+        self._groups_view: tuple[Mapping[str, Any], ...] | None = None
+        self._instance_info_view: Mapping[str, Any] | None = None
+        self._groups_dirty = False
+        self._groups_columns: dict[str, Any] = {}
+        self._groups_path = hass.config.path(
+            ".storage", f"{STORAGE_KEY}_{entry_id}_{GROUPS_FILE_SUFFIX}"
+        )
+        # One writer task drains side-file writes; a burst of changes only
+        # writes the latest list
+        self._groups_pending: list[dict[str, Any]] | None = None
+        self._groups_writer: asyncio.Task | None = None
+        self._start_unsub: CALLBACK_TYPE | None = None
+        self._last_write = 0.0
+        # Throttles connection state writes; while set, changes only update
+        # the data and are written when it fires
+        self._state_flush: asyncio.TimerHandle | None = None
 
     async def async_load(self) -> dict[str, Any]:
         """Load data from storage."""
         if self._loaded:
             return self._data
 
-        stored = await self._store.async_load()
+        # The side file is read alongside the Store; it is ignored below if
+        # the Store still holds groups from an older version
+        stored, groups_columns = await asyncio.gather(
+            self._store.async_load(),
+            self.hass.async_add_executor_job(self._read_groups_file),
+            return_exceptions=True,
+        )
+        for result in (stored, groups_columns):
+            if isinstance(result, BaseException) and not isinstance(result, Exception):
+                raise result
+        if isinstance(stored, Exception):
+            _LOGGER.warning("Could not load stored data, using defaults: %s", stored)
+            stored = None
+        if isinstance(groups_columns, Exception):
+            _LOGGER.warning("Could not load stored groups: %s", groups_columns)
+            groups_columns = {}
+
         if stored:
             self._data = stored
             _LOGGER.debug("Loaded Evolution API data from storage: %s keys", len(self._data))
@@ -41,63 +195,245 @@ class EvolutionApiStorage:
             self._data = self._get_default_data()
             _LOGGER.debug("No stored data found, using defaults")
 
+        legacy_columns = self._data.pop("groups_columns", None)
+        if legacy_columns is not None:
+            # Groups from before the side file; move them there
+            self._groups_columns = legacy_columns
+            self._groups_dirty = True
+            self._version += 1
+            self.async_schedule_save()
+        else:
+            self._groups_columns = groups_columns
+
         self._loaded = True
         return self._data
 
+    def _read_groups_file(self) -> dict[str, Any]:
+        """Read the groups side file."""
+        try:
+            with gzip.open(self._groups_path, "rb") as file:
+                return _dedupe_strings(json_loads(file.read()))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as err:
+            _LOGGER.warning("Could not read stored groups, starting empty: %s", err)
+            return {}
+
+    def _write_groups_file(self, groups: list[dict[str, Any]]) -> None:
+        """Write the groups side file, replacing the old one in one step."""
+        tmp_path = f"{self._groups_path}.tmp"
+        with open(tmp_path, "wb") as file:
+            with gzip.GzipFile(fileobj=file, mode="wb", compresslevel=3) as gz_file:
+                gz_file.write(json_bytes(_groups_to_columns(groups)))
+            # On disk before the rename, so a crash leaves the old or new file
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, self._groups_path)
+
+    @callback
+    def _queue_groups_write(self, groups: list[dict[str, Any]]) -> None:
+        """Queue the groups side file write, starting the writer if idle."""
+        self._groups_pending = groups
+        if self._groups_writer is None or self._groups_writer.done():
+            self._groups_writer = self.hass.async_create_task(
+                self._async_groups_writer()
+            )
+
+    async def _async_groups_writer(self) -> None:
+        """Write queued groups lists in the executor until none are left."""
+        while self._groups_pending is not None:
+            groups, self._groups_pending = self._groups_pending, None
+            try:
+                await self.hass.async_add_executor_job(self._write_groups_file, groups)
+            except OSError as err:
+                _LOGGER.error("Failed to save groups for entry %s: %s", self.entry_id, err)
+
+    async def async_flush(self) -> None:
+        """Write pending changes now, e.g. before the entry is unloaded."""
+        if self._start_unsub is not None:
+            self._start_unsub()
+            self._start_unsub = None
+        if self._state_flush is not None:
+            self._state_flush.cancel()
+            self._state_flush = None
+        await self.async_save()
+        if self._groups_writer is not None:
+            await self._groups_writer
+
+    async def async_remove(self) -> None:
+        """Delete the Store and the groups side file, e.g. when the entry is removed."""
+        await self._store.async_remove()
+        await self.hass.async_add_executor_job(self._remove_groups_file)
+
+    def _remove_groups_file(self) -> None:
+        """Delete the groups side file and any temporary file a write left."""
+        for path in (self._groups_path, f"{self._groups_path}.tmp"):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            except OSError as err:
+                _LOGGER.warning("Could not remove %s: %s", path, err)
+
+    @callback
     def _get_default_data(self) -> dict[str, Any]:
         """Get default data structure."""
-        return {
-            "groups": [],
-            "groups_count": 0,
-            "groups_last_updated": None,
-            "connection_state": "unknown",
-            "connection_last_updated": None,
-            "instance_info": {},
-        }
+        # The only mutable value gets a fresh dict; the rest is shared
+        return {**_DEFAULT_DATA, "instance_info": {}}
 
     async def async_save(self) -> None:
         """Save data to storage."""
-        await self._store.async_save(self._data)
+        if self._version == self._saved_version:
+            return
+        await self._store.async_save(self._data_to_save())
         _LOGGER.debug("Saved Evolution API data to storage")
 
+    @callback
+    def async_schedule_save(self, delay: float = SAVE_DELAY) -> None:
+        """Write data to storage after a delay, coalescing repeated calls.
+
+        The store also flushes a pending write when Home Assistant stops.
+        """
+        if self._version == self._saved_version:
+            return
+        if self.hass.state in (CoreState.not_running, CoreState.starting):
+            # Leave the disk to the integrations still starting up; the
+            # write is scheduled once startup has finished
+            if self._start_unsub is None:
+                self._start_unsub = async_at_started(
+                    self.hass, self._async_save_at_started
+                )
+            return
+        self._store.async_delay_save(self._data_to_save, delay)
+
+    @callback
+    def _async_save_at_started(self, _hass: HomeAssistant) -> None:
+        """Schedule the save deferred while Home Assistant was starting."""
+        self._start_unsub = None
+        self.async_schedule_save()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data to write, marking the current version saved."""
+        self._saved_version = self._version
+        self._last_write = time.monotonic()
+        self._format_stamps()
+        if self._groups_dirty:
+            self._groups_dirty = False
+            self._queue_groups_write(self._group_list())
+        return self._data
+
+    @callback
+    def _format_stamps(self) -> None:
+        """Store pending update times in their on-disk ISO form."""
+        for key, timestamp in self._pending_stamps.items():
+            self._data[key] = dt_util.as_local(
+                dt_util.utc_from_timestamp(timestamp)
+            ).isoformat()
+        self._pending_stamps.clear()
+
+    @callback
+    def set_groups(self, groups: list[dict[str, Any]]) -> bool:
+        """Update groups data in memory without writing it to disk.
+
+        Returns whether the list differs from the stored one. Only a changed
+        list counts as an update, so memory and disk never disagree.
+        """
+        if groups == self._group_list():
+            return False
+        self._version += 1
+        self._groups_dirty = True
+        self._groups = groups
+        self._groups_view = None
+        self._data["groups_count"] = len(groups)
+        self._pending_stamps["groups_last_updated"] = time.time()
+        return True
+
     async def async_save_groups(self, groups: list[dict[str, Any]]) -> None:
         """Save groups data."""
-        self._data["groups"] = groups
-        self._data["groups_count"] = len(groups)
-        self._data["groups_last_updated"] = dt_util.now().isoformat()
-        await self.async_save()
-        _LOGGER.info("Saved %d groups to storage", len(groups))
+        if not self.set_groups(groups):
+            return
+        self.async_schedule_save()
+        _LOGGER.info("Scheduled saving %d groups to storage", len(groups))
 
     async def async_save_connection_state(self, state: str, instance_info: dict[str, Any] | None = None) -> None:
         """Save connection state."""
+        # Reporting what is already stored needs no write
+        if state == self._data.get("connection_state") and (
+            not instance_info or instance_info == self._data.get("instance_info")
+        ):
+            return
+        self._version += 1
         self._data["connection_state"] = state
-        self._data["connection_last_updated"] = dt_util.now().isoformat()
+        self._pending_stamps["connection_last_updated"] = time.time()
         if instance_info:
             self._data["instance_info"] = instance_info
-        await self.async_save()
+            self._instance_info_view = None
+        if self._state_flush is not None:
+            # A write is already due; it picks up this change as well
+            return
+        since_write = time.monotonic() - self._last_write
+        self._state_flush = self.hass.loop.call_later(
+            max(SAVE_DELAY, CONNECTION_SAVE_INTERVAL - since_write),
+            self._async_flush_connection_state,
+        )
+
+    @callback
+    def _async_flush_connection_state(self) -> None:
+        """Write the connection state changes collected by the throttle."""
+        self._state_flush = None
+        self.async_schedule_save(0)
+
+    @callback
+    def _group_list(self) -> list[dict[str, Any]]:
+        """Return the groups as dicts, rebuilding them on first use."""
+        if self._groups is None:
+            self._groups = _columns_to_groups(self._groups_columns)
+            self._groups_columns = {}
+        return self._groups
 
-    def get_groups(self) -> list[dict[str, Any]]:
-        """Get stored groups."""
-        return self._data.get("groups", [])
+    @callback
+    def get_groups(self) -> tuple[Mapping[str, Any], ...]:
+        """Get stored groups as a read-only view."""
+        if self._groups_view is None:
+            self._groups_view = tuple(
+                MappingProxyType(group) for group in self._group_list()
+            )
+        return self._groups_view
 
+    @callback
     def get_groups_count(self) -> int:
         """Get stored groups count."""
         return self._data.get("groups_count", 0)
 
+    @callback
     def get_groups_last_updated(self) -> str | None:
         """Get last updated timestamp for groups."""
+        self._format_stamps()
         return self._data.get("groups_last_updated")
 
+    @callback
     def get_connection_state(self) -> str:
         """Get stored connection state."""
         return self._data.get("connection_state", "unknown")
 
-    def get_instance_info(self) -> dict[str, Any]:
-        """Get stored instance info."""
-        return self._data.get("instance_info", {})
+    @callback
+    def get_instance_info(self) -> Mapping[str, Any]:
+        """Get stored instance info as a read-only view."""
+        if self._instance_info_view is None:
+            self._instance_info_view = MappingProxyType(
+                self._data.get("instance_info", {})
+            )
+        return self._instance_info_view
 
     async def async_reset(self) -> None:
         """Reset storage to defaults."""
         self._data = self._get_default_data()
+        self._pending_stamps.clear()
+        self._groups = []
+        self._groups_dirty = True
+        self._groups_view = None
+        self._instance_info_view = None
+        self._version += 1
         await self.async_save()
         _LOGGER.info("Reset Evolution API storage to defaults")
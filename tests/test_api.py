@@ -0,0 +1,47 @@
+"""Tests for the Evolution API client."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from custom_components.evolution_api.api import EvolutionApiClient, EvolutionApiError
+
+
+def _check_connection(result: Any = None, side_effect: Any = None) -> bool:
+    """Run check_connection against a stubbed connection state response."""
+    client = EvolutionApiClient(None, "http://localhost:8080", "instance", "key")
+    with patch.object(
+        EvolutionApiClient,
+        "get_connection_state",
+        AsyncMock(return_value=result, side_effect=side_effect),
+    ):
+        return asyncio.run(client.check_connection())
+
+
+@pytest.mark.parametrize(
+    "result",
+    [
+        None,
+        [],
+        "OPEN",
+        {"instance": None},
+        {"instance": {"state": None}},
+        {"instance": {"state": "close"}},
+    ],
+)
+def test_check_connection_not_open(result: Any) -> None:
+    """Test anything but an open state dict reports not connected."""
+    assert _check_connection(result) is False
+
+
+def test_check_connection_open() -> None:
+    """Test an open instance reports connected."""
+    assert _check_connection({"instance": {"state": "open"}}) is True
+
+
+def test_check_connection_error() -> None:
+    """Test an API error reports not connected."""
+    assert _check_connection(side_effect=EvolutionApiError("boom")) is False